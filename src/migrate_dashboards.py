@@ -20,39 +20,139 @@ Usage:
     python src/migrate_dashboards.py --dashboard-csv data/dashboard_list.csv --publish
 """
 
+from __future__ import annotations
+
 import argparse
+import copy
+import csv
 import email.utils
+import hashlib
+import html
+import importlib.util
 import json
 import logging
+import math
 import os
+import queue
+import random
 import re
 import smtplib
 import sys
+import threading
 import time
+import warnings
+from collections import deque
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Pattern, Union
 
-import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     import yaml
     YAML_AVAILABLE = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
 except ImportError:
     YAML_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pandas, numpy and pyarrow are imported where they are used, so --help and
+# argument errors don't pay for loading them
+if TYPE_CHECKING:
+    import pandas as pd
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 # ============================================================================
 # Configuration Constants
 # ============================================================================
 
 PAGE_SIZE = 100
+HOST_SCHEMES = ("http://", "https://")
 REQUEST_TIMEOUT = 30
+HTTP_POOL_SIZE = 32
+MAX_WORKSPACE_WORKERS = 8
+# Lakeview fields used in the log; when the list API returns all of them, the detail GET is skipped
+LAKEVIEW_DETAIL_FIELDS = frozenset({"display_name", "path", "create_time", "update_time"})
+# Lakeview list pages requested ahead while earlier pages are still being enriched
+LAKEVIEW_PREFETCH_PAGES = 2
+# Up to this many selected dashboard IDs are fetched one by one instead of listing all dashboards
+MAX_DIRECT_FETCH_IDS = 500
 DEFAULT_SLEEP_BETWEEN_CALLS = 0.2
+# Bounds for the call interval after the API answers 429 Too Many Requests
+THROTTLE_MIN_INTERVAL = 0.1
+THROTTLE_MAX_INTERVAL = 5.0
+# A throttled interval shrinks by this factor per interval without 429s, back toward the configured one
+THROTTLE_RECOVERY_FACTOR = 0.9
+DEFAULT_CONCURRENCY = 8
+DEFAULT_LIST_CACHE_TTL = 0
+DEFAULT_PUBLISHED_CACHE_TTL = 0
+PUBLISHED_CACHE_SUFFIX = "-published"
+LIST_CACHE_DIR = Path.home() / ".cache" / "dbx_migrate"
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1
+DEFAULT_RETRY_CAP = 30.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+CHECKPOINT_SUFFIX = ".partial"
+CLI_UNSET = object()  # Placeholder default of options not given on the command line
+TEMP_SUFFIX = ".tmp"  # Log files are written under this suffix, then renamed into place
+BANNER = "=" * 60  # Separator line around workspace and summary log sections
+LOG_CSV_CHUNK_SIZE = 50_000  # Rows converted per batch when writing the log CSV
+PYARROW_CSV_MIN_ROWS = 10_000  # Logs larger than this are written with pyarrow when installed
+# Column names recognized as dashboard IDs in --dashboard-csv files, in priority order
+DASHBOARD_ID_COLUMNS = ('legacy_id', 'id', 'dashboard_id', 'dashboardId')
+# At least 8 characters of letters, digits, hyphens or underscores (not only separators)
+WAREHOUSE_ID_PATTERN = re.compile(r"(?=.*[A-Za-z0-9])[A-Za-z0-9_-]{8,}")
+
+# Columns of the migration log CSV, in output order
+LOG_COLUMNS = [
+    "workspace",  # Workspace identifier
+    "legacy_id",
+    "legacy_name",
+    "legacy_path",
+    "legacy_created_at",
+    "lakeview_id",
+    "migrated",
+    "migration_datetime",
+    "published",
+    "publish_datetime",
+    "deleted_legacy",
+    "error",
+    "dashboard_type",
+    "name",  # Dashboard name
+    "path",  # Dashboard path
+    "created_date",  # Created date (datetime)
+    "published_date",  # Published date (datetime)
+    "owner",  # Owner/creator
+    "updated_at",  # Last updated
+    "description",  # Description
+]
+# Log columns holding booleans (written as True/False in the CSV)
+BOOL_LOG_COLUMNS = ("migrated", "published", "deleted_legacy")
+# Column dtypes of the log DataFrame; everything except the flags is text
+LOG_SCHEMA = {col: ("bool" if col in BOOL_LOG_COLUMNS else "object") for col in LOG_COLUMNS}
+
+# API fields holding each log field, in order of preference ("a.b" looks up key b of a nested dict)
+FIELD_ALIASES = {
+    "owner": ("owner", "user.user_name", "user_name", "creator.user_name", "created_by"),
+    "created_at": ("created_at", "create_time", "created_time"),
+    "updated_at": ("updated_at", "update_time", "modified_at", "last_modified"),
+    "description": ("description", "summary", "display_description"),
+    "published_at": ("published_at", "publish_datetime"),
+}
 
 # ============================================================================
 # Logging Configuration
@@ -65,18 +165,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Set when the run is interrupted (Ctrl-C); workers check it before each
+# migrate/publish/delete step so no new changes are started afterwards
+stop_event = threading.Event()
+
 
 # ============================================================================
 # Utility Functions
 # ============================================================================
 
-def retry_on_failure(max_retries: int = DEFAULT_MAX_RETRIES, delay: float = DEFAULT_RETRY_DELAY):
+def retry_on_failure(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    delay: float = DEFAULT_RETRY_DELAY,
+    cap: float = DEFAULT_RETRY_CAP
+):
     """
     Decorator to retry function calls on transient failures.
     
+    Uses exponential backoff with full jitter: each retry sleeps a random
+    duration between 0 and min(cap, delay * 2**attempt). A Retry-After header
+    on the error response takes precedence over the computed delay.
+    Connection errors, timeouts and retryable HTTP statuses (429, 5xx) are
+    retried; other HTTP errors (400, 401, 403, 404, ...) fail immediately.
+    
     Args:
-        max_retries: Maximum number of retry attempts
-        delay: Initial delay between retries (increases with each attempt)
+        max_retries: Maximum number of attempts
+        delay: Base delay in seconds (doubles with each attempt)
+        cap: Maximum backoff delay in seconds
     """
     def decorator(func):
         @wraps(func)
@@ -85,23 +200,414 @@ def retry_on_failure(max_retries: int = DEFAULT_MAX_RETRIES, delay: float = DEFA
             for attempt in range(max_retries):
                 try:
                     return func(*args, **kwargs)
-                except requests.RequestException as e:
+                except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                    if not is_retryable_error(e):
+                        raise
                     last_exception = e
                     if attempt < max_retries - 1:
-                        sleep_time = delay * (attempt + 1)
+                        sleep_time = get_retry_after(e.response, max_wait=cap)
+                        if sleep_time is None:
+                            sleep_time = random.uniform(0, min(cap, delay * (2 ** attempt)))
                         logger.warning(
-                            f"{func.__name__} failed (attempt {attempt + 1}/{max_retries}): "
-                            f"{type(e).__name__}. Retrying in {sleep_time}s..."
+                            "%s failed (attempt %d/%d): %s. Retrying in %.2fs...",
+                            func.__name__, attempt + 1, max_retries, type(e).__name__, sleep_time
                         )
-                        time.sleep(sleep_time)
+                        # Wake up early when the run is interrupted; the retry is then refused
+                        stop_event.wait(sleep_time)
                     else:
-                        logger.error(f"{func.__name__} failed after {max_retries} attempts")
+                        logger.error("%s failed after %d attempts", func.__name__, max_retries)
             if last_exception:
                 raise last_exception
         return wrapper
     return decorator
 
 
+def is_retryable_error(error: requests.RequestException) -> bool:
+    """
+    Check whether a failed request is worth retrying.
+    
+    Args:
+        error: Exception raised by requests
+        
+    Returns:
+        bool: True for connection errors, timeouts and retryable HTTP statuses
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code in RETRYABLE_STATUS_CODES
+
+
+def get_retry_after(
+    response: Optional[requests.Response],
+    max_wait: float = DEFAULT_RETRY_CAP
+) -> Optional[float]:
+    """
+    Read the Retry-After header (in seconds) from a 429/503 response.
+    
+    Args:
+        response: HTTP response object, if any
+        max_wait: Upper bound for the returned wait, so a bogus header can't stall a worker
+        
+    Returns:
+        float: Seconds to wait (at most max_wait), or None if the header is
+        absent or not a finite number
+    """
+    if response is None or response.status_code not in (429, 503):
+        return None
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return None
+    try:
+        seconds = float(retry_after)
+    except ValueError:
+        return None
+    if not math.isfinite(seconds):
+        return None
+    return min(max(0.0, seconds), max_wait)
+
+
+class MigrationInterrupted(Exception):
+    """Raised for an API call that would start after the run was interrupted."""
+
+
+class Workspace(NamedTuple):
+    """A Databricks workspace to migrate."""
+    
+    name: str
+    host: str
+    token: str
+
+
+class CsvLogWriter:
+    """
+    Append migration log rows to a CSV file from a background thread.
+    
+    Worker threads queue rows as soon as a dashboard is processed; a single
+    daemon thread writes and flushes them, so the file holds every completed
+    row even if the run is interrupted. If a row cannot be written (e.g. the
+    disk is full), the error is logged and kept in error, and later rows are
+    dropped.
+    """
+    
+    def __init__(self, path: str, fieldnames: List[str], append: bool = False):
+        """
+        Open the CSV file and start the writer thread.
+        
+        Args:
+            path: Path to the CSV file
+            fieldnames: Column names, in output order
+            append: Append to an existing file instead of truncating it
+        """
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(file_path)
+        self.error: Optional[Exception] = None
+        write_header = not (append and file_path.exists() and file_path.stat().st_size > 0)
+        self._file = open(file_path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+        if write_header:
+            self._writer.writeheader()
+            self._file.flush()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="csv-log-writer", daemon=True)
+        self._thread.start()
+    
+    def write(self, row: Dict) -> None:
+        """Queue a snapshot of a log row for writing (ignored once writing has failed)."""
+        if self.error is None:
+            self._queue.put(dict(row))
+    
+    def close(self) -> None:
+        """
+        Write all queued rows, stop the writer thread and close the file.
+        A write error is reported as a warning, since the checkpoint is then incomplete.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._file.close()
+        except OSError as e:
+            self.error = self.error or e
+        if self.error is not None:
+            logger.warning(
+                "Checkpoint file %s is incomplete (%s); a resumed run may redo some dashboards",
+                self.path, self.error
+            )
+    
+    def _run(self) -> None:
+        while True:
+            row = self._queue.get()
+            if row is None:
+                break
+            try:
+                self._writer.writerow(row)
+                self._file.flush()
+            except Exception as e:
+                logger.error("Failed to write checkpoint row to %s: %s", self.path, e)
+                self.error = e
+                break
+
+
+def empty_log_dataframe() -> pd.DataFrame:
+    """Return an empty migration log with the typed LOG_SCHEMA columns."""
+    import pandas as pd
+    
+    return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in LOG_SCHEMA.items()})
+
+
+def write_log_csv(df: pd.DataFrame, log_file: str) -> None:
+    """
+    Write the migration log to a CSV file with the csv module.
+    
+    The log has a fixed schema of plain values, so its rows are streamed
+    straight from the DataFrame instead of going through DataFrame.to_csv.
+    Large logs are written by pyarrow's native CSV writer when it is
+    installed (it quotes every text value, which reads back the same).
+    
+    The file is written under a temporary name and then renamed over
+    log_file, so an interrupted write never leaves a truncated log behind.
+    
+    Args:
+        df: Migration log
+        log_file: Path to the CSV file
+    """
+    tmp_file = log_file + TEMP_SUFFIX
+    try:
+        written = False
+        if PYARROW_AVAILABLE and len(df) > PYARROW_CSV_MIN_ROWS:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            
+            try:
+                # Spell flags as True/False like the csv module does, not true/false
+                table = pa.Table.from_pandas(
+                    df.astype({col: str for col in BOOL_LOG_COLUMNS}), preserve_index=False
+                )
+                with open(tmp_file, 'wb') as f:
+                    pacsv.write_csv(table, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                written = True
+            except pa.ArrowException as e:
+                logger.debug("pyarrow could not write %s, using the csv module: %s", log_file, e)
+        
+        if not written:
+            with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(df.columns)
+                # Missing values are written as empty fields, as DataFrame.to_csv does;
+                # filling in batches keeps only one batch copied in memory at a time
+                for start in range(0, len(df), LOG_CSV_CHUNK_SIZE):
+                    chunk = df.iloc[start:start + LOG_CSV_CHUNK_SIZE].fillna("")
+                    writer.writerows(chunk.itertuples(index=False, name=None))
+                f.flush()
+                os.fsync(f.fileno())
+        
+        os.replace(tmp_file, log_file)
+    except BaseException:
+        Path(tmp_file).unlink(missing_ok=True)
+        raise
+
+
+class MigrationLogIndex:
+    """
+    Look up previously migrated dashboards in earlier migration logs.
+    
+    Only each row's key and its position in the CSV file are kept in memory;
+    the row itself is read back from disk when a resumed dashboard needs it.
+    Rows are appended after the index is built, never rewritten, so the
+    recorded positions stay valid while the checkpoint file grows.
+    """
+    
+    def __init__(self):
+        """Create an empty index."""
+        self._positions: Dict[str, tuple] = {}
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+    
+    def __len__(self) -> int:
+        return len(self._positions)
+    
+    def add(self, key: str, path: str, fieldnames: List[str], offset: int) -> None:
+        """
+        Record where the log row for a key starts.
+        
+        Args:
+            key: "workspace:legacy_id" key of the row
+            path: Path to the CSV file holding the row
+            fieldnames: Header of that CSV file
+            offset: Position of the row in the file, as returned by tell()
+        """
+        self._positions[key] = (path, fieldnames, offset)
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Read the log row for a key.
+        
+        Args:
+            key: "workspace:legacy_id" key of the row
+            
+        Returns:
+            dict: Log row with boolean flags converted, or None if the key is unknown
+        """
+        position = self._positions.get(key)
+        if position is None:
+            return None
+        path, fieldnames, offset = position
+        with open(path, newline='', encoding='utf-8') as f:
+            f.seek(offset)
+            row = dict(zip(fieldnames, next(csv.reader(f))))
+        for col in BOOL_LOG_COLUMNS:
+            row[col] = (row.get(col) or '').lower() == 'true'
+        return row
+
+
+class RateLimiter:
+    """
+    Space out API calls shared by several threads.
+    
+    Each call to wait() reserves the next free slot, so concurrent workers
+    together make at most one call per interval while their requests
+    still overlap on the network. throttle() slows every worker down when
+    the API reports that it is rate limiting us, and recover() speeds them
+    back up to the configured interval as calls succeed again.
+    """
+    
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: Minimum number of seconds between two calls (0 disables limiting)
+        """
+        self.base_interval = interval
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._last_throttle = float("-inf")
+        self._last_recover = float("-inf")
+    
+    def wait(self) -> None:
+        """Block until the caller may make its next API call."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            stop_event.wait(slot - now)
+    
+    def throttle(self, delay: float = 0) -> None:
+        """
+        Pause all callers for delay seconds and halve the call rate.
+        
+        Concurrent workers usually hit the limit together, so the rate is
+        halved at most once per interval; further 429s within that window
+        only extend the pause.
+        
+        Args:
+            delay: Seconds before the next call may start (e.g. from Retry-After)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._next_slot = max(self._next_slot, now + delay)
+            if now - self._last_throttle < self.interval:
+                return
+            self._last_throttle = now
+            self.interval = min(max(self.interval * 2, THROTTLE_MIN_INTERVAL), THROTTLE_MAX_INTERVAL)
+            interval = self.interval
+        logger.warning("API rate limit hit; slowing down to one call every %.2fs", interval)
+    
+    def recover(self) -> None:
+        """
+        Move a throttled interval one step back toward the configured interval.
+        
+        Like throttle(), this takes effect at most once per interval, and
+        never within an interval of the last 429, so a busy pool of workers
+        cannot undo the back-off in a handful of calls.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self.interval <= self.base_interval:
+                return
+            if now - max(self._last_throttle, self._last_recover) < self.interval:
+                return
+            self._last_recover = now
+            interval = self.interval * THROTTLE_RECOVERY_FACTOR
+            # Below the smallest throttled interval, snap back to the configured one
+            if interval < max(self.base_interval, THROTTLE_MIN_INTERVAL):
+                interval = self.base_interval
+            self.interval = interval
+
+
+class RateLimitedSession(requests.Session):
+    """
+    requests.Session that passes every request through a shared RateLimiter.
+    
+    A 429 response throttles the limiter, so all workers using the session
+    back off together instead of each one hammering the API; any other
+    response lets it recover.
+    """
+    
+    def __init__(self, rate_limiter: RateLimiter):
+        """
+        Args:
+            rate_limiter: Rate limiter shared by all users of the session
+        """
+        super().__init__()
+        self.rate_limiter = rate_limiter
+    
+    def request(self, method, url, *args, **kwargs) -> requests.Response:
+        self.rate_limiter.wait()
+        if stop_event.is_set():
+            raise MigrationInterrupted(f"{method} {url} not sent: run interrupted")
+        response = super().request(method, url, *args, **kwargs)
+        if response.status_code == 429:
+            self.rate_limiter.throttle(get_retry_after(response) or 0)
+        else:
+            self.rate_limiter.recover()
+        return response
+
+
+def loads_json(data: Union[bytes, str]) -> object:
+    """
+    Parse a JSON document, using orjson when it is installed.
+    
+    Args:
+        data: Raw JSON bytes or text
+        
+    Returns:
+        object: Parsed JSON value
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response: requests.Response) -> object:
+    """
+    Parse the JSON body of an API response (see loads_json).
+    
+    Args:
+        response: HTTP response object
+        
+    Returns:
+        object: Parsed JSON value
+        
+    Raises:
+        requests.JSONDecodeError: If the body is not valid JSON (a
+            RequestException, like the error of response.json())
+    """
+    try:
+        return loads_json(response.content)
+    except ValueError as e:
+        raise requests.JSONDecodeError(getattr(e, "msg", str(e)), response.text, getattr(e, "pos", 0)) from e
+
+
 def extract_error_details(response: requests.Response) -> str:
     """
     Extract detailed error information from API response.
@@ -113,7 +619,7 @@ def extract_error_details(response: requests.Response) -> str:
         str: Error message extracted from response
     """
     try:
-        error_json = response.json()
+        error_json = response_json(response)
         # Try common error message locations
         if isinstance(error_json, dict):
             error_msg = (
@@ -128,6 +634,34 @@ def extract_error_details(response: requests.Response) -> str:
         return response.text
 
 
+def utc_now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 timestamp (e.g. 2024-01-31T12:00:00Z).
+    
+    Returns:
+        str: Timestamp with second precision and a Z suffix
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+
+
+def format_request_error(prefix: str, error: requests.RequestException) -> str:
+    """
+    Format a failed request for the log's error column.
+    
+    Args:
+        prefix: Failed operation (e.g. "migrate_error")
+        error: Exception raised by requests
+        
+    Returns:
+        str: "<prefix>: <ExceptionType>: <details>", with details taken from
+            the API response when there is one
+    """
+    response = getattr(error, 'response', None)
+    details = extract_error_details(response) if response is not None else str(error)
+    return f"{prefix}: {type(error).__name__}: {details}"
+
+
+@lru_cache(maxsize=16)
 def normalize_host(host: Optional[str]) -> Optional[str]:
     """
     Normalize host URL by removing trailing slash and validating format.
@@ -144,7 +678,7 @@ def normalize_host(host: Optional[str]) -> Optional[str]:
     if not host:
         return None
     host = host.rstrip('/')
-    if not host.startswith(('http://', 'https://')):
+    if not host.startswith(HOST_SCHEMES):
         raise ValueError(f"Host must start with http:// or https://: {host}")
     return host
 
@@ -159,14 +693,12 @@ def validate_warehouse_id(warehouse_id: Optional[str]) -> None:
     Raises:
         ValueError: If warehouse ID format is invalid
     """
-    if warehouse_id:
-        # Databricks warehouse IDs are typically alphanumeric with hyphens
-        cleaned = warehouse_id.replace('-', '').replace('_', '')
-        if not cleaned.isalnum() or len(warehouse_id) < 8:
-            raise ValueError(
-                f"Invalid warehouse ID format: {warehouse_id}. "
-                "Expected alphanumeric string with optional hyphens/underscores."
-            )
+    # Databricks warehouse IDs are typically alphanumeric with hyphens
+    if warehouse_id and not WAREHOUSE_ID_PATTERN.fullmatch(warehouse_id):
+        raise ValueError(
+            f"Invalid warehouse ID format: {warehouse_id}. "
+            "Expected alphanumeric string with optional hyphens/underscores."
+        )
 
 
 def load_dashboard_selection(
@@ -188,53 +720,115 @@ def load_dashboard_selection(
     # Load from comma-separated list
     if dashboard_ids:
         selected_ids.extend([id.strip() for id in dashboard_ids.split(',') if id.strip()])
-        logger.info(f"Loaded {len(selected_ids)} dashboard IDs from --dashboard-ids")
+        logger.info("Loaded %d dashboard IDs from --dashboard-ids", len(selected_ids))
     
     # Load from CSV file
     if dashboard_csv:
         try:
-            df = pd.read_csv(dashboard_csv)
+            import pandas as pd
+            
+            # Only parse the candidate ID columns, as strings (no type inference)
+            df = pd.read_csv(
+                dashboard_csv,
+                usecols=lambda c: c in DASHBOARD_ID_COLUMNS,
+                dtype=str,
+                engine='c'
+            )
             # Try common column names for dashboard ID
             id_column = None
-            for col in ['legacy_id', 'id', 'dashboard_id', 'dashboardId']:
+            for col in DASHBOARD_ID_COLUMNS:
                 if col in df.columns:
                     id_column = col
                     break
             
             if id_column:
-                csv_ids = df[id_column].dropna().astype(str).tolist()
+                csv_ids = df[id_column].dropna().tolist()
                 selected_ids.extend(csv_ids)
-                logger.info(f"Loaded {len(csv_ids)} dashboard IDs from CSV file {dashboard_csv}")
+                logger.info("Loaded %d dashboard IDs from CSV file %s", len(csv_ids), dashboard_csv)
             else:
                 logger.warning(
-                    f"CSV file {dashboard_csv} does not contain a recognized ID column. "
-                    f"Expected one of: legacy_id, id, dashboard_id, dashboardId"
+                    "CSV file %s does not contain a recognized ID column. "
+                    "Expected one of: %s",
+                    dashboard_csv, ", ".join(DASHBOARD_ID_COLUMNS)
                 )
         except Exception as e:
-            logger.error(f"Failed to load dashboard IDs from CSV {dashboard_csv}: {e}")
+            logger.error("Failed to load dashboard IDs from CSV %s: %s", dashboard_csv, e)
     
     # Remove duplicates while preserving order
-    if selected_ids:
-        seen = set()
-        unique_ids = []
-        for id in selected_ids:
-            if id not in seen:
-                seen.add(id)
-                unique_ids.append(id)
-        return unique_ids
+    return list(dict.fromkeys(selected_ids)) if selected_ids else None
+
+
+def compile_filter_pattern(pattern: Optional[Union[str, Pattern]]) -> Optional[Pattern]:
+    """
+    Compile a case-insensitive dashboard filter pattern.
     
-    return None
+    Args:
+        pattern: Regex string, already compiled pattern, or None
+        
+    Returns:
+        Compiled pattern, or None if no pattern was given
+        
+    Raises:
+        re.error: If the pattern is not a valid regex
+    """
+    if not pattern or isinstance(pattern, re.Pattern):
+        return pattern or None
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def first_present(data: Dict, keys: tuple) -> object:
+    """
+    Return the first non-empty value among several possible keys.
+    
+    Args:
+        data: Dictionary from the API
+        keys: Keys to try in order; "a.b" looks up key b of the nested dict a
+        
+    Returns:
+        The first truthy value found, or an empty string
+    """
+    for key in keys:
+        value = data
+        for part in key.split("."):
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(part)
+        if value:
+            return value
+    return ""
+
+
+def get_dashboard_owner(dashboard: Dict) -> str:
+    """
+    Resolve the owner of a legacy dashboard from its possible owner fields.
+    
+    Args:
+        dashboard: Legacy dashboard dictionary
+        
+    Returns:
+        str: Owner name, user ID or empty string if none is set
+    """
+    user = dashboard.get("user") or {}
+    return (
+        dashboard.get("owner") or
+        user.get("user_name") or
+        dashboard.get("user_name") or
+        str(user.get("id", ""))
+    )
 
 
 def filter_dashboards(
     dashboards: List[Dict],
-    path_pattern: Optional[str] = None,
-    owner_pattern: Optional[str] = None,
-    name_pattern: Optional[str] = None,
+    path_pattern: Optional[Union[str, Pattern]] = None,
+    owner_pattern: Optional[Union[str, Pattern]] = None,
+    name_pattern: Optional[Union[str, Pattern]] = None,
     selected_ids: Optional[List[str]] = None
 ) -> List[Dict]:
     """
     Filter dashboards based on path, owner, name patterns, or selected IDs.
+    String patterns are matched case-insensitively; compiled patterns
+    (see compile_filter_pattern) are used as-is.
     
     Args:
         dashboards: List of dashboard dictionaries
@@ -246,59 +840,84 @@ def filter_dashboards(
     Returns:
         List[Dict]: Filtered list of dashboards
     """
-    filtered = dashboards
+    import pandas as pd
+    
+    if not dashboards:
+        return dashboards
+    
+    path_pattern = compile_filter_pattern(path_pattern)
+    owner_pattern = compile_filter_pattern(owner_pattern)
+    name_pattern = compile_filter_pattern(name_pattern)
+    
+    def matches(values: pd.Series, pattern: Pattern) -> pd.Series:
+        # Filter patterns are user-supplied regexes; capture groups in them are harmless
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="This pattern is interpreted as a regular expression")
+            return values.str.contains(pattern, regex=True, na=False)
+    
+    # Evaluate every filter as a vectorized mask over one DataFrame of the dashboards
+    df = pd.DataFrame(dashboards)
+    empty = pd.Series("", index=df.index, dtype=object)
+    mask = pd.Series(True, index=df.index)
     
     # First, filter by selected IDs if provided (most restrictive - only these dashboards)
     if selected_ids:
         id_set = set(str(id) for id in selected_ids)
-        filtered = [d for d in filtered if str(d.get("id", "")) in id_set]
-        logger.info(f"Filtered by selected IDs: {len(filtered)} dashboards")
-        if len(filtered) == 0:
+        mask &= df.get("id", empty).astype(str).isin(id_set)
+        logger.info("Filtered by selected IDs: %d dashboards", mask.sum())
+        if not mask.any():
             logger.warning("No dashboards found matching the provided IDs. Check that IDs are correct.")
-            return filtered
+            return []
     
     # Then apply pattern filters (AND logic - all filters must match)
     if path_pattern:
-        pattern = re.compile(path_pattern, re.IGNORECASE)
-        before_count = len(filtered)
-        filtered = [d for d in filtered if pattern.search(d.get("path", "") or d.get("dashboard_path", ""))]
-        logger.info(f"Filtered by path pattern '{path_pattern}': {len(filtered)} dashboards (from {before_count})")
+        path = df.get("path", empty).fillna("")
+        path = path.where(path.astype(bool), df.get("dashboard_path", empty).fillna(""))
+        before_count = mask.sum()
+        mask &= matches(path.astype(str), path_pattern)
+        logger.info(
+            "Filtered by path pattern '%s': %d dashboards (from %d)", path_pattern.pattern, mask.sum(), before_count
+        )
     
     if owner_pattern:
-        pattern = re.compile(owner_pattern, re.IGNORECASE)
-        before_count = len(filtered)
-        # Try multiple possible owner field locations
-        filtered = [
-            d for d in filtered
-            if pattern.search(d.get("owner", "") or 
-                            d.get("user", {}).get("user_name", "") or
-                            d.get("user_name", "") or
-                            str(d.get("user", {}).get("id", "")))
-        ]
-        logger.info(f"Filtered by owner pattern '{owner_pattern}': {len(filtered)} dashboards (from {before_count})")
+        # Resolve the owner field once per dashboard
+        owner = pd.Series([get_dashboard_owner(d) for d in dashboards], index=df.index, dtype=object)
+        before_count = mask.sum()
+        mask &= matches(owner, owner_pattern)
+        logger.info(
+            "Filtered by owner pattern '%s': %d dashboards (from %d)", owner_pattern.pattern, mask.sum(), before_count
+        )
     
     if name_pattern:
-        pattern = re.compile(name_pattern, re.IGNORECASE)
-        before_count = len(filtered)
-        filtered = [d for d in filtered if pattern.search(d.get("name", ""))]
-        logger.info(f"Filtered by name pattern '{name_pattern}': {len(filtered)} dashboards (from {before_count})")
+        name = df.get("name", empty).fillna("")
+        before_count = mask.sum()
+        mask &= matches(name.astype(str), name_pattern)
+        logger.info(
+            "Filtered by name pattern '%s': %d dashboards (from %d)", name_pattern.pattern, mask.sum(), before_count
+        )
     
-    return filtered
+    # Return the original dictionaries (not DataFrame records) so missing keys stay missing
+    return [d for d, keep in zip(dashboards, mask) if keep]
 
 
 def send_email_summary(
     df: pd.DataFrame,
     args: argparse.Namespace,
-    host: str
+    host: str,
+    stats: Dict[str, int]
 ) -> None:
     """
     Send email summary of migration results via SMTP.
     
     Args:
-        df: Migration log DataFrame
+        df: Migration log DataFrame (used for the details table only)
         args: Parsed command line arguments
         host: Databricks workspace URL
+        stats: Counts computed once by main(): "total", "migrated", "failed",
+            "published" and "deleted" dashboards
     """
+    import pandas as pd
+    
     if not args.send_email:
         return
     
@@ -307,18 +926,26 @@ def send_email_summary(
         return
     
     # Prepare email content
-    total = len(df)
+    total = stats["total"]
+    migrated = stats["migrated"]
     if total == 0:
         logger.warning("No dashboards to include in email summary")
         return
     
-    migrated = df['migrated'].sum()
-    failed = (~df['migrated']).sum()
-    published = df['published'].sum() if args.publish and 'published' in df.columns else 0
-    deleted = df['deleted_legacy'].sum() if args.delete_legacy and 'deleted_legacy' in df.columns else 0
-    
     subject = f"Dashboard Migration Summary - {migrated}/{total} migrated"
     
+    # Render the details table in one pass; cell values are HTML-escaped
+    empty = pd.Series("", index=df.index, dtype=object)
+    details = pd.DataFrame({
+        "Legacy ID": df["legacy_id"],
+        "Name": df["legacy_name"],
+        "Path": df.get("legacy_path", empty),
+        "Lakeview ID": df.get("lakeview_id", empty),
+        "Status": df["migrated"].map(lambda m: "✅ Migrated" if m else "❌ Failed"),
+        "Error": df.get("error", empty).fillna("").astype(str).str.slice(0, 100),
+    })
+    table_html = details.to_html(index=False, escape=True, na_rep="", border=0, justify="left", classes="migration")
+    
     # Create HTML email body
     html_body = f"""
     <html>
@@ -340,47 +967,34 @@ def send_email_summary(
             <ul>
                 <li><strong>Total Dashboards:</strong> {total}</li>
                 <li><strong class="success">Successfully Migrated:</strong> {migrated}</li>
-                <li><strong class="error">Failed Migrations:</strong> {failed}</li>
-                {f'<li><strong>Published:</strong> {published}</li>' if args.publish else ''}
-                {f'<li><strong>Deleted Legacy:</strong> {deleted}</li>' if args.delete_legacy else ''}
+                <li><strong class="error">Failed Migrations:</strong> {stats["failed"]}</li>
+                {f'<li><strong>Published:</strong> {stats["published"]}</li>' if args.publish else ''}
+                {f'<li><strong>Deleted Legacy:</strong> {stats["deleted"]}</li>' if args.delete_legacy else ''}
             </ul>
         </div>
         
         <h3>Migration Details</h3>
-        <table>
-            <tr>
-                <th>Legacy ID</th>
-                <th>Name</th>
-                <th>Path</th>
-                <th>Lakeview ID</th>
-                <th>Status</th>
-                <th>Error</th>
-            </tr>
-    """
-    
-    # Add rows for each dashboard
-    for _, row in df.iterrows():
-        status = "✅ Migrated" if row['migrated'] else "❌ Failed"
-        status_class = "success" if row['migrated'] else "error"
-        error = row.get('error', '') or ''
-        html_body += f"""
-            <tr>
-                <td>{row['legacy_id']}</td>
-                <td>{row['legacy_name']}</td>
-                <td>{row.get('legacy_path', 'N/A')}</td>
-                <td>{row.get('lakeview_id', 'N/A')}</td>
-                <td class="{status_class}">{status}</td>
-                <td>{error[:100] if error else ''}</td>
-            </tr>
-        """
-    
-    html_body += """
-        </table>
-        <p><em>Full details available in log file: """ + args.log_file + """</em></p>
+        {table_html}
+        <p><em>Full details available in log file: {html.escape(args.log_file)}</em></p>
     </body>
     </html>
     """
     
+    # Plain text alternative built from the same statistics
+    text_lines = [
+        "Dashboard Migration Summary",
+        "",
+        f"Total Dashboards: {total}",
+        f"Successfully Migrated: {migrated}",
+        f"Failed Migrations: {stats['failed']}",
+    ]
+    if args.publish:
+        text_lines.append(f"Published: {stats['published']}")
+    if args.delete_legacy:
+        text_lines.append(f"Deleted Legacy: {stats['deleted']}")
+    text_lines += ["", "See HTML version for full details."]
+    text_body = "\n".join(text_lines)
+    
     # Send email via SMTP
     if not args.smtp_username or not args.smtp_password:
         logger.error(
@@ -395,14 +1009,15 @@ def send_email_summary(
             args.email_to,
             subject,
             html_body,
+            text_body,
             args.smtp_server,
             args.smtp_port,
             args.smtp_username,
             args.smtp_password
         )
-        logger.info(f"Email summary sent to {args.email_to}")
+        logger.info("Email summary sent to %s", args.email_to)
     except Exception as e:
-        logger.error(f"Failed to send email: {e}")
+        logger.error("Failed to send email: %s", e)
 
 
 def send_smtp_email(
@@ -410,6 +1025,7 @@ def send_smtp_email(
     to_addrs: str,
     subject: str,
     html_body: str,
+    text_body: str,
     smtp_server: str,
     smtp_port: int,
     username: str,
@@ -423,6 +1039,7 @@ def send_smtp_email(
         to_addrs: Comma-separated recipient email addresses
         subject: Email subject
         html_body: HTML email body
+        text_body: Plain text alternative of the email body
         smtp_server: SMTP server hostname
         smtp_port: SMTP server port
         username: SMTP username
@@ -438,25 +1055,6 @@ def send_smtp_email(
     msg['Subject'] = subject
     msg['Date'] = email.utils.formatdate(localtime=True)
     
-    # Create plain text version (extract key info from HTML)
-    total_match = re.search(r'<li><strong>Total Dashboards:</strong> (\d+)</li>', html_body)
-    migrated_match = re.search(r'<li><strong class="success">Successfully Migrated:</strong> (\d+)</li>', html_body)
-    failed_match = re.search(r'<li><strong class="error">Failed Migrations:</strong> (\d+)</li>', html_body)
-    
-    total = total_match.group(1) if total_match else "N/A"
-    migrated = migrated_match.group(1) if migrated_match else "N/A"
-    failed = failed_match.group(1) if failed_match else "N/A"
-    
-    text_body = f"""
-Dashboard Migration Summary
-
-Total Dashboards: {total}
-Successfully Migrated: {migrated}
-Failed Migrations: {failed}
-
-See HTML version for full details.
-    """
-    
     # Attach both plain text and HTML
     part1 = MIMEText(text_body, 'plain')
     part2 = MIMEText(html_body, 'html')
@@ -470,6 +1068,42 @@ See HTML version for full details.
         server.send_message(msg)
 
 
+@lru_cache(maxsize=8)
+def parse_config_file(config_path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a YAML or JSON configuration file.
+    Cached on (path, modification time), so loading an unchanged file
+    again skips parsing.
+    
+    Args:
+        config_path: Resolved path to configuration file
+        mtime_ns: Modification time of the file in nanoseconds (cache key)
+        
+    Returns:
+        Parsed configuration (not yet validated)
+    """
+    # Raw bytes: both parsers detect the encoding themselves and skip newline translation
+    with open(config_path, 'rb') as f:
+        content = f.read()
+    
+    if config_path.endswith('.yaml') or config_path.endswith('.yml'):
+        if not YAML_AVAILABLE:
+            raise ImportError(
+                "YAML support not available. Install PyYAML: pip install pyyaml"
+            )
+        return yaml.load(content, Loader=YamlLoader)
+    if config_path.endswith('.json'):
+        return loads_json(content)
+    
+    # Try to auto-detect format
+    if YAML_AVAILABLE:
+        try:
+            return yaml.load(content, Loader=YamlLoader)
+        except yaml.YAMLError:
+            pass
+    return loads_json(content)
+
+
 def load_config_file(config_path: str) -> Dict:
     """
     Load configuration from YAML or JSON file.
@@ -484,40 +1118,24 @@ def load_config_file(config_path: str) -> Dict:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config file format is invalid
     """
-    config_file = Path(config_path)
-    if not config_file.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    # Resolve symlinks and relative paths so every spelling of a file shares one cache entry
+    resolved_path = str(Path(config_path).resolve())
+    try:
+        mtime_ns = os.stat(resolved_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
     
-    with open(config_file, 'r', encoding='utf-8') as f:
-        if config_path.endswith('.yaml') or config_path.endswith('.yml'):
-            if not YAML_AVAILABLE:
-                raise ImportError(
-                    "YAML support not available. Install PyYAML: pip install pyyaml"
-                )
-            config = yaml.safe_load(f)
-        elif config_path.endswith('.json'):
-            config = json.load(f)
-        else:
-            # Try to auto-detect format
-            content = f.read()
-            f.seek(0)
-            try:
-                if YAML_AVAILABLE:
-                    config = yaml.safe_load(f)
-                else:
-                    config = json.load(f)
-            except (yaml.YAMLError if YAML_AVAILABLE else ValueError):
-                f.seek(0)
-                config = json.load(f)
+    # Copy so callers can never modify the cached parse result
+    config = copy.deepcopy(parse_config_file(resolved_path, mtime_ns))
     
     if not isinstance(config, dict):
         raise ValueError(f"Config file must contain a dictionary/object, got {type(config)}")
     
-    logger.info(f"Loaded configuration from {config_path}")
+    logger.info("Loaded configuration from %s", config_path)
     return config
 
 
-def parse_workspaces_from_config(config: Dict) -> List[Dict]:
+def parse_workspaces_from_config(config: Dict) -> List[Workspace]:
     """
     Parse workspace configurations from config file.
     Supports both single workspace (host/token) and multiple workspaces (workspaces list).
@@ -526,49 +1144,45 @@ def parse_workspaces_from_config(config: Dict) -> List[Dict]:
         config: Configuration dictionary from file
         
     Returns:
-        List of workspace dictionaries with 'name', 'host', and 'token' keys
+        List of Workspace tuples
     """
-    workspaces = []
-    
     # Check for multiple workspaces configuration
     if "workspaces" in config and isinstance(config["workspaces"], list):
-        for idx, ws in enumerate(config["workspaces"]):
-            if isinstance(ws, dict):
-                ws_name = ws.get("name") or ws.get("workspace") or f"workspace_{idx + 1}"
-                ws_host = ws.get("host")
-                ws_token = ws.get("token")
-                
-                if ws_host and ws_token:
-                    workspaces.append({
-                        "name": ws_name,
-                        "host": ws_host,
-                        "token": ws_token
-                    })
-                else:
-                    logger.warning(f"Skipping workspace {ws_name}: missing host or token")
+        candidates = [
+            Workspace(
+                ws.get("name") or ws.get("workspace") or f"workspace_{idx + 1}",
+                ws.get("host"),
+                ws.get("token")
+            )
+            for idx, ws in enumerate(config["workspaces"])
+            if isinstance(ws, dict)
+        ]
+        for ws in candidates:
+            if not (ws.host and ws.token):
+                logger.warning("Skipping workspace %s: missing host or token", ws.name)
+        return [ws for ws in candidates if ws.host and ws.token]
     
     # Fall back to single workspace configuration (backward compatibility)
-    elif "host" in config and "token" in config:
-        workspaces.append({
-            "name": config.get("workspace_name") or config.get("workspace") or "default",
-            "host": config["host"],
-            "token": config["token"]
-        })
-    
-    return workspaces
+    if "host" in config and "token" in config:
+        return [Workspace(
+            config.get("workspace_name") or config.get("workspace") or "default",
+            config["host"],
+            config["token"]
+        )]
+    
+    return []
 
 
-def merge_config_with_args(config: Dict, args: argparse.Namespace) -> argparse.Namespace:
+def merge_config_with_args(config: Dict, args: argparse.Namespace) -> None:
     """
-    Merge configuration file values with command-line arguments.
-    Command-line arguments take precedence over config file values.
+    Merge configuration file values into command-line arguments, in place.
+    Command-line arguments take precedence over config file values: only
+    arguments still set to CLI_UNSET (not given on the command line) are
+    filled in from the config.
     
     Args:
         config: Configuration dictionary from file
         args: Parsed command-line arguments namespace
-        
-    Returns:
-        argparse.Namespace: Merged arguments namespace
     """
     # Map config keys to argument names (handle both snake_case and kebab-case)
     # Priority: CLI args > config file > defaults/env vars
@@ -596,6 +1210,11 @@ def merge_config_with_args(config: Dict, args: argparse.Namespace) -> argparse.N
         'max-retries': 'max_retries',
         'retry_delay': 'retry_delay',
         'retry-delay': 'retry_delay',
+        'concurrency': 'concurrency',
+        'list_cache_ttl': 'list_cache_ttl',
+        'list-cache-ttl': 'list_cache_ttl',
+        'published_cache_ttl': 'published_cache_ttl',
+        'published-cache-ttl': 'published_cache_ttl',
         'resume': 'resume',
         'log_level': 'log_level',
         'log-level': 'log_level',
@@ -622,22 +1241,11 @@ def merge_config_with_args(config: Dict, args: argparse.Namespace) -> argparse.N
     # Boolean flags that should be checked differently
     boolean_flags = {'delete_legacy', 'publish', 'dry_run', 'resume', 'send_email'}
     
-    # Track which args were explicitly set via CLI
-    # Check sys.argv to see what was actually provided
-    cli_args_provided = set()
-    for i, arg in enumerate(sys.argv[1:], 1):
-        if arg.startswith('--'):
-            arg_name = arg.lstrip('--').replace('-', '_')
-            cli_args_provided.add(arg_name)
-            # For boolean flags, the presence of the flag means True
-            if arg_name in boolean_flags:
-                setattr(args, arg_name, True)
-    
     # Apply config values only if not explicitly set via CLI
     for config_key, arg_name in config_mapping.items():
         if config_key in config:
             # Skip if CLI argument was explicitly provided
-            if arg_name in cli_args_provided:
+            if getattr(args, arg_name, CLI_UNSET) is not CLI_UNSET:
                 continue  # CLI arg was set, skip config
             
             # Apply config value
@@ -653,43 +1261,59 @@ def merge_config_with_args(config: Dict, args: argparse.Namespace) -> argparse.N
                     setattr(args, arg_name, config_value.lower() in ('true', '1', 'yes', 'on'))
             else:
                 setattr(args, arg_name, config_value)
-    
-    return args
 
 
-def load_existing_log(log_file: str) -> Dict[str, Dict]:
+def load_existing_log(log_file: str) -> MigrationLogIndex:
     """
     Load existing migration log to resume from previous run.
+    Rows from an interrupted run's checkpoint file (log_file + ".partial")
+    take precedence over the last completed log.
     
     Args:
         log_file: Path to existing log CSV file
         
     Returns:
-        Dict: Dictionary mapping "workspace:legacy_id" to log row for successfully migrated dashboards
+        MigrationLogIndex: Index keyed by "workspace:legacy_id" of the log rows
+        of successfully migrated dashboards
     """
-    if not os.path.exists(log_file):
-        return {}
+    result = MigrationLogIndex()
+    sources = [f for f in (log_file, log_file + CHECKPOINT_SUFFIX) if os.path.exists(f)]
+    if not sources:
+        return result
     
+    # Single pass over the raw CSV rows, remembering where each migrated one starts
     try:
-        df = pd.read_csv(log_file)
-        # Return only successfully migrated dashboards with lakeview_id
-        migrated = df[
-            (df['migrated'] == True) & 
-            (df['lakeview_id'].notna()) & 
-            (df['lakeview_id'] != '')
-        ]
-        result = {}
-        for _, row in migrated.iterrows():
-            # Use workspace:legacy_id as key for multi-workspace support
-            workspace = str(row.get('workspace', 'default'))
-            legacy_id = str(row['legacy_id'])
-            key = f"{workspace}:{legacy_id}"
-            result[key] = row.to_dict()
-        logger.info(f"Loaded {len(result)} previously migrated dashboards from {log_file}")
+        for source in sources:
+            with open(source, newline='', encoding='utf-8') as f:
+                header = f.readline()
+                if not header:
+                    continue
+                fieldnames = next(csv.reader([header]))
+                # csv.reader pulls one line at a time, so tell() after each row
+                # is where the next row starts
+                reader = csv.reader(iter(f.readline, ''))
+                offset = f.tell()
+                for values in reader:
+                    row = dict(zip(fieldnames, values))
+                    row_offset, offset = offset, f.tell()
+                    legacy_id = row.get('legacy_id') or ''
+                    lakeview_id = row.get('lakeview_id') or ''
+                    # Only successfully migrated legacy dashboards with a lakeview_id
+                    # (dry-run rows carry placeholder IDs and were never actually migrated)
+                    if (
+                        (row.get('migrated') or '').lower() != 'true' or
+                        not legacy_id or
+                        not lakeview_id or
+                        lakeview_id.startswith('dry-run-')
+                    ):
+                        continue
+                    # Use workspace:legacy_id as key for multi-workspace support
+                    result.add(f"{row.get('workspace') or 'default'}:{legacy_id}", source, fieldnames, row_offset)
+        logger.info("Loaded %d previously migrated dashboards from %s", len(result), ", ".join(sources))
         return result
     except Exception as e:
-        logger.warning(f"Could not load existing log file {log_file}: {e}")
-        return {}
+        logger.warning("Could not load existing log file %s: %s", log_file, e)
+        return MigrationLogIndex()
 
 
 # ============================================================================
@@ -768,7 +1392,7 @@ def parse_arguments() -> argparse.Namespace:
         "--sleep-between-calls",
         type=float,
         default=DEFAULT_SLEEP_BETWEEN_CALLS,
-        help=f"Seconds to sleep between API calls (default: {DEFAULT_SLEEP_BETWEEN_CALLS}).",
+        help=f"Minimum seconds between API calls, shared by all workers (default: {DEFAULT_SLEEP_BETWEEN_CALLS}).",
     )
     parser.add_argument(
         "--max-retries",
@@ -782,6 +1406,27 @@ def parse_arguments() -> argparse.Namespace:
         default=DEFAULT_RETRY_DELAY,
         help=f"Initial delay between retries in seconds (default: {DEFAULT_RETRY_DELAY}).",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of dashboards to migrate/publish/delete in parallel (default: {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--list-cache-ttl",
+        type=float,
+        default=DEFAULT_LIST_CACHE_TTL,
+        help="Seconds to reuse a cached legacy dashboard list before revalidating it "
+             f"(default: {DEFAULT_LIST_CACHE_TTL}, caching disabled).",
+    )
+    parser.add_argument(
+        "--published-cache-ttl",
+        type=float,
+        default=DEFAULT_PUBLISHED_CACHE_TTL,
+        help="Cache Lakeview published-status checks, revalidating published dashboards by ETag "
+             "and trusting 'not published' results for this many seconds "
+             f"(default: {DEFAULT_PUBLISHED_CACHE_TTL}, caching disabled).",
+    )
     parser.add_argument(
         "--resume",
         action="store_true",
@@ -848,18 +1493,38 @@ def parse_arguments() -> argparse.Namespace:
         help="SMTP password (or set SMTP_PASSWORD env var).",
     )
     
-    # Parse arguments first
+    # Parse with every default replaced by CLI_UNSET, so an option given on the
+    # command line is recognized even when its value equals the default
+    defaults = {action.dest: action.default for action in parser._actions if action.dest != "help"}
+    parser.set_defaults(**dict.fromkeys(defaults, CLI_UNSET))
     args = parser.parse_args()
     
     # Load config file if specified and merge with CLI arguments
-    if args.config:
+    if args.config is not CLI_UNSET:
         try:
             config = load_config_file(args.config)
-            args = merge_config_with_args(config, args)
+            merge_config_with_args(config, args)
         except Exception as e:
-            logger.error(f"Failed to load config file {args.config}: {e}")
+            logger.error("Failed to load config file %s: %s", args.config, e)
             raise SystemExit(f"Config file error: {e}")
     
+    # Whatever neither the command line nor the config set keeps its default
+    for name, default in defaults.items():
+        if getattr(args, name) is CLI_UNSET:
+            setattr(args, name, default)
+    
+    # Every worker pool is sized from the concurrency, whether it came from the CLI or the config
+    if isinstance(args.concurrency, bool) or not isinstance(args.concurrency, int) or args.concurrency < 1:
+        raise SystemExit(f"Invalid concurrency: {args.concurrency!r} (must be an integer of at least 1)")
+    
+    # Compile filter patterns once, failing fast on invalid regexes
+    try:
+        args.filter_path_re = compile_filter_pattern(args.filter_path)
+        args.filter_owner_re = compile_filter_pattern(args.filter_owner)
+        args.filter_name_re = compile_filter_pattern(args.filter_name)
+    except re.error as e:
+        raise SystemExit(f"Invalid filter pattern: {e}")
+    
     return args
 
 
@@ -867,17 +1532,30 @@ def parse_arguments() -> argparse.Namespace:
 # API Functions
 # ============================================================================
 
-def create_session(token: str) -> requests.Session:
+def create_session(
+    token: str,
+    pool_size: int = HTTP_POOL_SIZE,
+    sleep_between_calls: float = DEFAULT_SLEEP_BETWEEN_CALLS
+) -> requests.Session:
     """
     Create and configure a requests session with authentication headers.
+    All requests made through the session share one rate limit.
     
     Args:
         token: Databricks PAT token
+        pool_size: Number of keep-alive connections to pool for the workspace host
+        sleep_between_calls: Minimum seconds between API calls across all threads
         
     Returns:
         requests.Session: Configured session object
     """
-    session = requests.Session()
+    session = RateLimitedSession(RateLimiter(sleep_between_calls))
+    # A session talks to a single workspace host, so one cached host pool is
+    # enough; it keeps a keep-alive connection for every worker thread.
+    # Retries are handled by retry_on_failure, so the adapter itself never retries.
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update({
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
@@ -885,143 +1563,438 @@ def create_session(token: str) -> requests.Session:
     return session
 
 
-def list_all_legacy_dashboards(
-    session: requests.Session,
-    host: str,
-    sleep_between_calls: float = DEFAULT_SLEEP_BETWEEN_CALLS
+def get_list_cache_path(session: requests.Session, host: str, suffix: str = "") -> Path:
+    """
+    Return the on-disk cache file for a workspace's legacy dashboard listing.
+    The file name hashes the host and credentials so different tokens
+    (which may see different dashboards) never share a cache entry.
+    
+    Args:
+        session: Authenticated requests session
+        host: Databricks workspace URL
+        suffix: Suffix distinguishing other per-workspace caches (e.g. "-published")
+        
+    Returns:
+        Path: Cache file location
+    """
+    key = f"{host}\n{session.headers.get('Authorization', '')}"
+    return LIST_CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}{suffix}.json"
+
+
+def load_list_cache(cache_file: Path) -> Optional[Dict]:
+    """
+    Load a cached dashboard listing.
+    
+    Args:
+        cache_file: Path to the cache file
+        
+    Returns:
+        Dict with 'etag', 'fetched_at' and 'dashboards' keys, or None if unavailable
+    """
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = loads_json(f.read())
+        if isinstance(cache, dict) and isinstance(cache.get("dashboards"), list):
+            return cache
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable list cache %s: %s", cache_file, e)
+    return None
+
+
+def save_list_cache(cache_file: Path, etag: Optional[str], dashboards: List[Dict]) -> None:
+    """
+    Persist a dashboard listing to the on-disk cache.
+    
+    Args:
+        cache_file: Path to the cache file
+        etag: ETag returned with the first page of the listing, if any
+        dashboards: Full list of dashboard dictionaries
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({"etag": etag, "fetched_at": time.time(), "dashboards": dashboards}, f)
+    except OSError as e:
+        logger.debug("Could not write list cache %s: %s", cache_file, e)
+
+
+def load_published_cache(cache_file: Path) -> Dict[str, Dict]:
+    """
+    Load cached Lakeview published-status responses.
+    
+    Args:
+        cache_file: Path to the cache file
+        
+    Returns:
+        Dict mapping dashboard ID to a cached entry with 'status', 'etag',
+        'body' and 'fetched_at' keys (empty if unavailable)
+    """
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = loads_json(f.read())
+        if isinstance(cache, dict):
+            return cache
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable published-status cache %s: %s", cache_file, e)
+    return {}
+
+
+def save_published_cache(cache_file: Path, entries: Dict[str, Dict]) -> None:
+    """
+    Persist Lakeview published-status responses to the on-disk cache.
+    
+    Args:
+        cache_file: Path to the cache file
+        entries: Dict mapping dashboard ID to its cached entry
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+    except OSError as e:
+        logger.debug("Could not write published-status cache %s: %s", cache_file, e)
+
+
+def get_list_page(
+    session: requests.Session,
+    url: str,
+    params: Dict,
+    headers: Optional[Dict] = None
+) -> requests.Response:
+    """
+    Request one page of a list API (callers wrap it in retry_on_failure).
+    
+    Args:
+        session: Authenticated requests session
+        url: List endpoint URL
+        params: Query parameters (page size and token)
+        headers: Optional extra request headers
+        
+    Returns:
+        requests.Response: Successful (2xx) or 304 Not Modified response
+        
+    Raises:
+        requests.HTTPError: If the API returns an error status
+    """
+    resp = session.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    return resp
+
+
+def list_all_legacy_dashboards(
+    session: requests.Session,
+    host: str,
+    cache_ttl: float = 0,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY
 ) -> List[Dict]:
     """
     Return a list of all legacy dashboards from the preview SQL dashboards API.
     Handles pagination until all dashboards are retrieved.
     
+    When cache_ttl is positive, the listing is cached on disk: a cache younger
+    than cache_ttl seconds is reused as-is, and an older one is revalidated by
+    sending its ETag via If-None-Match (a 304 reuses the cached list).
+    
     Args:
         session: Authenticated requests session
         host: Databricks workspace URL
+        cache_ttl: Seconds a cached listing is reused without revalidation (0 disables caching)
+        max_retries: Maximum attempts per page request
+        retry_delay: Base delay in seconds between retries
         
     Returns:
         list: List of dashboard dictionaries
     """
     url = f"{host}/api/2.0/preview/sql/dashboards"
+    get_page = retry_on_failure(max_retries, retry_delay)(get_list_page)
     page_token = None
     all_dashboards = []
     
+    cache_file = get_list_cache_path(session, host) if cache_ttl > 0 else None
+    cache = load_list_cache(cache_file) if cache_file else None
+    if cache and time.time() - cache.get("fetched_at", 0) < cache_ttl:
+        logger.info("Using cached legacy dashboard list (%s dashboards)", len(cache['dashboards']))
+        return cache["dashboards"]
+    etag = None
+    
     while True:
         params = {"page_size": PAGE_SIZE}
+        headers = {}
         if page_token:
             params["page_token"] = page_token
+        elif cache and cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
             
-        resp = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        payload = resp.json()
+        resp = get_page(session, url, params, headers)
+        if resp.status_code == 304:
+            logger.info("Legacy dashboard list unchanged; using cached list (%s dashboards)", len(cache['dashboards']))
+            save_list_cache(cache_file, cache["etag"], cache["dashboards"])
+            return cache["dashboards"]
+        payload = response_json(resp)
+        if not page_token:
+            etag = resp.headers.get("ETag")
         
         all_dashboards.extend(payload.get("results", []))
         page_token = payload.get("next_page_token")
         
         if not page_token:
             break
-            
-        time.sleep(sleep_between_calls)
+    
+    if cache_file:
+        save_list_cache(cache_file, etag, all_dashboards)
     
     return all_dashboards
 
 
+def get_legacy_dashboard(session: requests.Session, host: str, dashboard_id: str) -> Dict:
+    """
+    Return a single legacy dashboard from the preview SQL dashboards API
+    (callers wrap it in retry_on_failure).
+    
+    Args:
+        session: Authenticated requests session
+        host: Databricks workspace URL
+        dashboard_id: Legacy dashboard ID
+        
+    Returns:
+        dict: Dashboard dictionary (same shape as the list API results)
+    """
+    url = f"{host}/api/2.0/preview/sql/dashboards/{dashboard_id}"
+    resp = session.get(url, timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    return response_json(resp)
+
+
+def get_legacy_dashboards_by_id(
+    session: requests.Session,
+    host: str,
+    dashboard_ids: List[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY
+) -> List[Dict]:
+    """
+    Fetch specific legacy dashboards concurrently instead of listing all of them.
+    Dashboards that don't exist or are in the trash are skipped with a warning.
+    
+    Args:
+        session: Authenticated requests session
+        host: Databricks workspace URL
+        dashboard_ids: Legacy dashboard IDs to fetch
+        concurrency: Maximum number of requests in flight
+        max_retries: Maximum attempts per dashboard request
+        retry_delay: Base delay in seconds between retries
+        
+    Returns:
+        list: List of dashboard dictionaries, in the order of dashboard_ids
+    """
+    get_dashboard = retry_on_failure(max_retries, retry_delay)(get_legacy_dashboard)
+    
+    def fetch(dashboard_id: str) -> Optional[Dict]:
+        try:
+            dashboard = get_dashboard(session, host, dashboard_id)
+        except requests.RequestException as e:
+            if getattr(e, 'response', None) is not None and e.response.status_code == 404:
+                logger.warning("Legacy dashboard %s not found", dashboard_id)
+            else:
+                logger.error("Could not fetch legacy dashboard %s: %s", dashboard_id, e)
+            return None
+        if dashboard.get("is_archived"):
+            logger.warning("Legacy dashboard %s is in the trash; skipping", dashboard_id)
+            return None
+        return dashboard
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return [d for d in executor.map(fetch, dashboard_ids) if d]
+
+
+def enrich_lakeview_dashboard(
+    session: requests.Session,
+    host: str,
+    dashboard: Dict,
+    published_cache: Optional[Dict[str, Dict]] = None,
+    published_cache_ttl: float = 0
+) -> Dict:
+    """
+    Add full details and published status to a Lakeview dashboard from the list API.
+    The list endpoint may only return limited fields, so the details are fetched
+    separately unless all LAKEVIEW_DETAIL_FIELDS are already present. The
+    dashboard dictionary is updated in place.
+    
+    When a published_cache is given, published responses are revalidated with
+    their ETag (a 304 reuses the cached body), and "not published" results
+    younger than published_cache_ttl seconds skip the request entirely.
+    
+    Args:
+        session: Authenticated requests session
+        host: Databricks workspace URL
+        dashboard: Dashboard dictionary from the list endpoint
+        published_cache: Cached published-status entries by dashboard ID, updated in place
+        published_cache_ttl: Seconds a cached "not published" result is trusted
+        
+    Returns:
+        dict: The updated dashboard dictionary
+    """
+    dashboard_id = dashboard.get("id") or dashboard.get("dashboard_id") or dashboard.get("object_id")
+    if not dashboard_id:
+        dashboard["is_published"] = dashboard.get("published", False)
+        dashboard["published_at"] = None
+        return dashboard
+    
+    # Fetch full dashboard details to get all fields (path, update_time, etc.),
+    # unless the list payload already has everything the log needs
+    if not LAKEVIEW_DETAIL_FIELDS.issubset(dashboard):
+        try:
+            detail_url = f"{host}/api/2.0/lakeview/dashboards/{dashboard_id}"
+            detail_resp = session.get(detail_url, timeout=REQUEST_TIMEOUT)
+            if detail_resp.status_code == 200:
+                detail_data = response_json(detail_resp)
+                # Merge full details into dashboard object
+                dashboard.update(detail_data)
+                # Ensure dashboard_id is set
+                if "dashboard_id" not in dashboard:
+                    dashboard["dashboard_id"] = dashboard_id
+        except (requests.RequestException, ValueError) as e:
+            logger.debug("Could not fetch full details for dashboard %s: %s", dashboard_id, e)
+    
+    # Try to get published status and published date from the published endpoint
+    # This endpoint returns 200 if published, 404 if not published
+    cached = published_cache.get(dashboard_id) if published_cache is not None else None
+    if cached and cached.get("status") == 404 and time.time() - cached.get("fetched_at", 0) < published_cache_ttl:
+        dashboard["is_published"] = False
+        dashboard["published_at"] = None
+        return dashboard
+    
+    try:
+        published_url = f"{host}/api/2.0/lakeview/dashboards/{dashboard_id}/published"
+        if cached and cached.get("etag"):
+            # Revalidate the cached published revision (a 304 has no body either)
+            published_resp = session.get(
+                published_url, headers={"If-None-Match": cached["etag"]}, timeout=REQUEST_TIMEOUT
+            )
+        else:
+            # Probe with HEAD so unpublished dashboards cost no body transfer;
+            # fetch the body only when the dashboard may be published (or HEAD is unsupported, e.g. 405)
+            published_resp = session.head(published_url, timeout=REQUEST_TIMEOUT, allow_redirects=False)
+            if published_resp.status_code != 404:
+                published_resp = session.get(published_url, timeout=REQUEST_TIMEOUT)
+        if published_resp.status_code == 304:
+            published_data = cached["body"]
+            cached["fetched_at"] = time.time()
+        elif published_resp.status_code == 200:
+            published_data = response_json(published_resp)
+        else:
+            published_data = None
+        
+        if published_cache is not None and published_resp.status_code in (200, 404):
+            published_cache[dashboard_id] = {
+                "status": published_resp.status_code,
+                "etag": published_resp.headers.get("ETag"),
+                "body": published_data,
+                "fetched_at": time.time(),
+            }
+        
+        if published_data is not None:
+            dashboard["is_published"] = True
+            # Get published date - use revision_create_time which is when it was published
+            dashboard["published_at"] = (
+                published_data.get("revision_create_time") or
+                published_data.get("published_at") or 
+                published_data.get("publish_time") or
+                published_data.get("created_at") or 
+                published_data.get("updated_at")
+            )
+        else:
+            dashboard["is_published"] = False
+            dashboard["published_at"] = None
+    except (requests.RequestException, ValueError) as e:
+        # If we can't check (404 means not published, other errors are logged but don't fail)
+        if hasattr(e, 'response') and e.response is not None:
+            if e.response.status_code == 404:
+                dashboard["is_published"] = False
+            else:
+                # Other error - default to False but log it
+                logger.debug("Could not check published status for dashboard %s: %s", dashboard_id, e)
+                dashboard["is_published"] = dashboard.get("published", False)
+        else:
+            dashboard["is_published"] = dashboard.get("published", False)
+        dashboard["published_at"] = None
+    
+    return dashboard
+
+
 def list_all_lakeview_dashboards(
     session: requests.Session,
     host: str,
-    sleep_between_calls: float = DEFAULT_SLEEP_BETWEEN_CALLS
+    concurrency: int = DEFAULT_CONCURRENCY,
+    published_cache_ttl: float = 0,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_delay: float = DEFAULT_RETRY_DELAY
 ) -> List[Dict]:
     """
     Return a list of all Lakeview (AI/BI) dashboards from the Lakeview API.
     Handles pagination until all dashboards are retrieved.
-    Also checks published status for each dashboard.
+    Also checks published status for each dashboard, fetching the details
+    of several dashboards in parallel while the next pages are listed.
     
     Args:
         session: Authenticated requests session
         host: Databricks workspace URL
+        concurrency: Number of dashboards to fetch details for in parallel
+        published_cache_ttl: Seconds a cached "not published" result is trusted;
+            when positive, published-status responses are cached on disk (0 disables caching)
+        max_retries: Maximum attempts per page request
+        retry_delay: Base delay in seconds between retries
         
     Returns:
         list: List of dashboard dictionaries with published status
     """
     url = f"{host}/api/2.0/lakeview/dashboards"
+    get_page = retry_on_failure(max_retries, retry_delay)(get_list_page)
     page_token = None
     all_dashboards = []
+    pending_pages = deque()
     
-    while True:
-        params = {"page_size": PAGE_SIZE}
-        if page_token:
-            params["page_token"] = page_token
+    cache_file = get_list_cache_path(session, host, PUBLISHED_CACHE_SUFFIX) if published_cache_ttl > 0 else None
+    published_cache = load_published_cache(cache_file) if cache_file else None
+    
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        while True:
+            params = {"page_size": PAGE_SIZE}
+            if page_token:
+                params["page_token"] = page_token
             
-        resp = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        payload = resp.json()
-        
-        # Lakeview API uses "dashboards" key, not "results"
-        dashboards = payload.get("dashboards", []) or payload.get("results", [])
-        
-        # Fetch full dashboard details and published status for each dashboard
-        # The list endpoint only returns limited fields, so we need to fetch details
-        for dashboard in dashboards:
-            dashboard_id = dashboard.get("id") or dashboard.get("dashboard_id") or dashboard.get("object_id")
-            if dashboard_id:
-                # Fetch full dashboard details to get all fields (path, update_time, etc.)
-                try:
-                    detail_url = f"{host}/api/2.0/lakeview/dashboards/{dashboard_id}"
-                    detail_resp = session.get(detail_url, timeout=REQUEST_TIMEOUT)
-                    if detail_resp.status_code == 200:
-                        detail_data = detail_resp.json()
-                        # Merge full details into dashboard object
-                        dashboard.update(detail_data)
-                        # Ensure dashboard_id is set
-                        if "dashboard_id" not in dashboard:
-                            dashboard["dashboard_id"] = dashboard_id
-                    time.sleep(sleep_between_calls)
-                except requests.RequestException as e:
-                    logger.debug(f"Could not fetch full details for dashboard {dashboard_id}: {e}")
-                
-                # Try to get published status and published date from the published endpoint
-                # This endpoint returns 200 if published, 404 if not published
-                try:
-                    published_url = f"{host}/api/2.0/lakeview/dashboards/{dashboard_id}/published"
-                    published_resp = session.get(published_url, timeout=REQUEST_TIMEOUT)
-                    if published_resp.status_code == 200:
-                        published_data = published_resp.json()
-                        dashboard["is_published"] = True
-                        # Get published date - use revision_create_time which is when it was published
-                        dashboard["published_at"] = (
-                            published_data.get("revision_create_time") or
-                            published_data.get("published_at") or 
-                            published_data.get("publish_time") or
-                            published_data.get("created_at") or 
-                            published_data.get("updated_at")
-                        )
-                    else:
-                        dashboard["is_published"] = False
-                        dashboard["published_at"] = None
-                    time.sleep(sleep_between_calls)
-                except requests.RequestException as e:
-                    # If we can't check (404 means not published, other errors are logged but don't fail)
-                    if hasattr(e, 'response') and e.response is not None:
-                        if e.response.status_code == 404:
-                            dashboard["is_published"] = False
-                        else:
-                            # Other error - default to False but log it
-                            logger.debug(f"Could not check published status for dashboard {dashboard_id}: {e}")
-                            dashboard["is_published"] = dashboard.get("published", False)
-                    else:
-                        dashboard["is_published"] = dashboard.get("published", False)
-                    dashboard["published_at"] = None
-                    time.sleep(sleep_between_calls)  # Small delay on error
-            else:
-                dashboard["is_published"] = dashboard.get("published", False)
-                dashboard["published_at"] = None
-        
-        all_dashboards.extend(dashboards)
-        page_token = payload.get("next_page_token")
-        
-        if not page_token:
-            break
+            resp = get_page(session, url, params)
+            payload = response_json(resp)
+            
+            # Lakeview API uses "dashboards" key, not "results"
+            dashboards = payload.get("dashboards", []) or payload.get("results", [])
             
-        time.sleep(sleep_between_calls)
+            # Fetch full dashboard details and published status for each dashboard;
+            # the workers run while the next page is requested
+            pending_pages.append(executor.map(
+                lambda d: enrich_lakeview_dashboard(
+                    session, host, d, published_cache, published_cache_ttl
+                ),
+                dashboards
+            ))
+            if len(pending_pages) > LAKEVIEW_PREFETCH_PAGES:
+                all_dashboards.extend(pending_pages.popleft())
+            page_token = payload.get("next_page_token")
+            
+            if not page_token:
+                break
+        
+        for page in pending_pages:
+            all_dashboards.extend(page)
+    
+    if cache_file:
+        save_published_cache(cache_file, published_cache)
     
     return all_dashboards
 
@@ -1046,7 +2019,7 @@ def migrate_legacy_dashboard(
         dict: Response JSON with new AI/BI dashboard information
     """
     if dry_run:
-        logger.info(f"[DRY RUN] Would migrate dashboard '{dashboard.get('name')}' ({dashboard.get('id')})")
+        logger.info("[DRY RUN] Would migrate dashboard '%s' (%s)", dashboard.get('name'), dashboard.get('id'))
         return {"id": f"dry-run-{dashboard.get('id')}", "dashboard_id": f"dry-run-{dashboard.get('id')}"}
     
     migrate_url = f"{host}/api/2.0/lakeview/dashboards/migrate"
@@ -1056,7 +2029,7 @@ def migrate_legacy_dashboard(
     }
     resp = session.post(migrate_url, json=body, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
-    return resp.json()
+    return response_json(resp)
 
 
 def publish_dashboard(
@@ -1080,7 +2053,7 @@ def publish_dashboard(
         dry_run: If True, simulate without making API call
     """
     if dry_run:
-        logger.info(f"[DRY RUN] Would publish dashboard {dashboard_id}")
+        logger.info("[DRY RUN] Would publish dashboard %s", dashboard_id)
         return
     
     url = f"{host}/api/2.0/lakeview/dashboards/{dashboard_id}/published"
@@ -1108,7 +2081,7 @@ def delete_legacy_dashboard(
         dry_run: If True, simulate without making API call
     """
     if dry_run:
-        logger.info(f"[DRY RUN] Would delete legacy dashboard {dashboard_id}")
+        logger.info("[DRY RUN] Would delete legacy dashboard %s", dashboard_id)
         return
     
     url = f"{host}/api/2.0/preview/sql/dashboards/{dashboard_id}"
@@ -1120,11 +2093,241 @@ def delete_legacy_dashboard(
 # Main Migration Logic
 # ============================================================================
 
+def migrate_one(
+    session: requests.Session,
+    host: str,
+    d: Dict,
+    args: argparse.Namespace,
+    workspace_name: str,
+    idx: int,
+    total: int
+) -> Dict:
+    """
+    Migrate a single legacy dashboard and build its log row.
+    
+    Args:
+        session: Authenticated requests session
+        host: Databricks workspace URL
+        d: Legacy dashboard dictionary
+        args: Parsed command line arguments
+        workspace_name: Name/identifier for the workspace being processed
+        idx: Position of the dashboard in the migration batch (1-based)
+        total: Number of dashboards in the migration batch
+        
+    Returns:
+        dict: Log row for this dashboard
+    """
+    legacy_id = str(d.get("id"))
+    legacy_name = d.get("name", "Unknown")
+    legacy_path = d.get("path") or d.get("dashboard_path")
+    legacy_created_at = first_present(d, FIELD_ALIASES["created_at"])
+    
+    logger.info("[%s] [%d/%d] Processing '%s' (%s)...", workspace_name, idx, total, legacy_name, legacy_id)
+    
+    migrated = False
+    deleted_legacy = False
+    lakeview_id = None
+    error_msg = ""
+    migration_datetime = None
+    publish_datetime = None
+    
+    try:
+        # Record migration timestamp in UTC before calling the API
+        migration_datetime = utc_now_iso()
+        
+        # Retry transient failures (connection errors, timeouts, 429/5xx)
+        result = retry_on_failure(args.max_retries, args.retry_delay)(migrate_legacy_dashboard)(
+            session, host, d, dry_run=args.dry_run
+        )
+        
+        if result:
+            lakeview_id = result.get("id") or result.get("dashboard_id")
+            migrated = True
+            logger.info("[%s] Migrated legacy '%s' (%s) -> AI/BI %s", workspace_name, legacy_name, legacy_id, lakeview_id)
+    except requests.RequestException as e:
+        # Handle both HTTPError and other request exceptions (timeouts, connection errors, etc.)
+        error_msg = format_request_error("migrate_error", e)
+        migration_datetime = None
+        logger.error("[%s] Failed to migrate '%s' (%s): %s", workspace_name, legacy_name, legacy_id, error_msg)
+    
+    # Get published status from dashboard data if available
+    # Legacy dashboards don't have published status, so it will be False initially
+    dashboard_published = d.get("published", False) or d.get("is_published", False)
+    
+    # Capture additional fields from dashboard data
+    owner = first_present(d, FIELD_ALIASES["owner"])
+    updated_at = first_present(d, FIELD_ALIASES["updated_at"])
+    description = first_present(d, FIELD_ALIASES["description"])
+    
+    # Ensure dates are in datetime format (ISO 8601)
+    created_date = legacy_created_at or ""
+    published_date = publish_datetime or ""
+    
+    return {
+        "workspace": workspace_name,  # Workspace identifier
+        "legacy_id": legacy_id,
+        "legacy_name": legacy_name,
+        "legacy_path": legacy_path,
+        "legacy_created_at": legacy_created_at,
+        "lakeview_id": lakeview_id,
+        "migrated": migrated,  # migrated and converted are the same
+        "migration_datetime": migration_datetime,
+        "published": dashboard_published,  # Get from dashboard data
+        "publish_datetime": publish_datetime,
+        "deleted_legacy": deleted_legacy,
+        "error": error_msg,
+        "dashboard_type": "legacy",
+        "name": legacy_name,  # Dashboard name
+        "path": legacy_path,  # Dashboard path
+        "created_date": created_date,  # Created date (datetime)
+        "published_date": published_date,  # Published date (datetime)
+        "owner": owner,
+        "updated_at": updated_at,
+        "description": description,
+    }
+
+
+def build_lakeview_row(d: Dict, path: str, workspace_name: str) -> Dict:
+    """
+    Build the log row of an existing Lakeview dashboard (for information only).
+    
+    Args:
+        d: Lakeview dashboard dictionary (see list_all_lakeview_dashboards)
+        path: Cleaned directory path of the dashboard
+        workspace_name: Name/identifier for the workspace being processed
+        
+    Returns:
+        dict: Log row for this dashboard
+    """
+    lakeview_id = str(d.get("id") or d.get("dashboard_id") or d.get("object_id", ""))
+    lakeview_name = d.get("name") or d.get("display_name") or "Unknown"
+    lakeview_created_at = first_present(d, FIELD_ALIASES["created_at"])
+    
+    # Get published status (already fetched in list_all_lakeview_dashboards)
+    is_published = d.get("is_published", False) or d.get("published", False)
+    published_at = first_present(d, FIELD_ALIASES["published_at"])
+    
+    # Capture additional fields from dashboard data (full details should be available now)
+    # Owner/creator might not be in API response, try multiple locations
+    owner = first_present(d, FIELD_ALIASES["owner"])
+    updated_at = first_present(d, FIELD_ALIASES["updated_at"])
+    description = first_present(d, FIELD_ALIASES["description"])
+    
+    return {
+        "workspace": workspace_name,  # Workspace identifier
+        "legacy_id": "",  # Not a legacy dashboard
+        "legacy_name": "",
+        "legacy_path": "",
+        "legacy_created_at": "",
+        "lakeview_id": lakeview_id,
+        "migrated": True,  # Lakeview dashboards are already migrated (converted)
+        "migration_datetime": "",  # No migration date since already in Lakeview
+        "published": is_published,  # Get from dashboard data
+        "publish_datetime": published_at,
+        "deleted_legacy": False,
+        "error": "",
+        "dashboard_type": "lakeview",
+        "name": lakeview_name,  # Dashboard name
+        "path": path,  # Dashboard path
+        "created_date": lakeview_created_at,  # Created date (datetime)
+        "published_date": published_at,  # Published date (datetime)
+        "owner": owner,
+        "updated_at": updated_at,
+        "description": description,
+    }
+
+
+def publish_one(
+    session: requests.Session,
+    host: str,
+    row: Dict,
+    args: argparse.Namespace,
+    workspace_name: str
+) -> Dict:
+    """
+    Publish the AI/BI dashboard of a migrated log row, updating the row in place.
+    
+    Args:
+        session: Authenticated requests session
+        host: Databricks workspace URL
+        row: Log row of a migrated dashboard
+        args: Parsed command line arguments
+        workspace_name: Name/identifier for the workspace being processed
+        
+    Returns:
+        dict: The updated log row
+    """
+    legacy_id = row["legacy_id"]
+    lakeview_id = row["lakeview_id"]
+    
+    try:
+        # Retry transient failures (connection errors, timeouts, 429/5xx)
+        retry_on_failure(args.max_retries, args.retry_delay)(publish_dashboard)(
+            session,
+            host,
+            lakeview_id,
+            warehouse_id=args.warehouse_id,
+            dry_run=args.dry_run
+        )
+        
+        row["published"] = True
+        publish_time = utc_now_iso()
+        row["publish_datetime"] = publish_time
+        row["published_date"] = publish_time  # Update published_date field (datetime)
+        logger.info("[%s] Published AI/BI dashboard %s for legacy %s", workspace_name, lakeview_id, legacy_id)
+    except requests.RequestException as e:
+        err = format_request_error("publish_error", e)
+        row["error"] = (row["error"] + "; " + err) if row["error"] else err
+        logger.error("[%s] Failed to publish AI/BI %s: %s", workspace_name, lakeview_id, err)
+    
+    return row
+
+
+def delete_one(
+    session: requests.Session,
+    host: str,
+    row: Dict,
+    args: argparse.Namespace,
+    workspace_name: str
+) -> Dict:
+    """
+    Delete the legacy dashboard of a migrated log row, updating the row in place.
+    
+    Args:
+        session: Authenticated requests session
+        host: Databricks workspace URL
+        row: Log row of a migrated dashboard
+        args: Parsed command line arguments
+        workspace_name: Name/identifier for the workspace being processed
+        
+    Returns:
+        dict: The updated log row
+    """
+    legacy_id = row["legacy_id"]
+    
+    try:
+        # Retry transient failures (connection errors, timeouts, 429/5xx)
+        retry_on_failure(args.max_retries, args.retry_delay)(delete_legacy_dashboard)(
+            session, host, legacy_id, dry_run=args.dry_run
+        )
+        
+        row["deleted_legacy"] = True
+        logger.info("[%s] Deleted legacy dashboard '%s' (%s)", workspace_name, row['legacy_name'], legacy_id)
+    except requests.RequestException as e:
+        err = format_request_error("delete_error", e)
+        row["error"] = (row["error"] + "; " + err) if row["error"] else err
+        logger.error("[%s] Failed to delete legacy '%s' (%s): %s", workspace_name, row['legacy_name'], legacy_id, err)
+    
+    return row
+
+
 def migrate_dashboards(
     session: requests.Session,
     host: str,
     args: argparse.Namespace,
-    workspace_name: str = "default"
+    workspace_name: str = "default",
+    existing_log: Optional[MigrationLogIndex] = None,
+    log_writer: Optional[CsvLogWriter] = None
 ) -> pd.DataFrame:
     """
     Main migration workflow: list, migrate, optionally publish and delete.
@@ -1134,14 +2337,25 @@ def migrate_dashboards(
         host: Databricks workspace URL
         args: Parsed command line arguments
         workspace_name: Name/identifier for the workspace being processed
+        existing_log: Previously migrated dashboards (see load_existing_log);
+            loaded from args.log_file when resuming and not provided
+        log_writer: Optional checkpoint writer that receives each legacy
+            dashboard's log row as soon as it is migrated, published or deleted,
+            followed by the Lakeview dashboard rows
         
     Returns:
         pandas.DataFrame: Log DataFrame with all migration results
     """
+    import pandas as pd
+    
     # Load existing log if resuming
-    existing_log = {}
-    if args.resume:
-        existing_log = load_existing_log(args.log_file)
+    if existing_log is None:
+        existing_log = load_existing_log(args.log_file) if args.resume else MigrationLogIndex()
+    
+    def checkpoint(row: Dict) -> Dict:
+        if log_writer:
+            log_writer.write(row)
+        return row
     
     # Load dashboard selection (IDs or CSV)
     selected_ids = load_dashboard_selection(
@@ -1149,48 +2363,65 @@ def migrate_dashboards(
         dashboard_csv=args.dashboard_csv
     )
     
-    # List all legacy dashboards
-    logger.info(f"[{workspace_name}] Fetching list of legacy dashboards...")
-    legacy_dashboards = list_all_legacy_dashboards(session, host, sleep_between_calls=args.sleep_between_calls)
-    logger.info(f"[{workspace_name}] Found {len(legacy_dashboards)} legacy dashboards")
-    
-    # List all Lakeview dashboards (for information gathering)
-    logger.info(f"[{workspace_name}] Fetching list of Lakeview dashboards...")
-    lakeview_dashboards = list_all_lakeview_dashboards(session, host, sleep_between_calls=args.sleep_between_calls)
-    logger.info(f"[{workspace_name}] Found {len(lakeview_dashboards)} Lakeview dashboards")
-    
-    # Combine both lists for CSV output
-    # Mark legacy dashboards with dashboard_type = "legacy"
-    for d in legacy_dashboards:
-        d["dashboard_type"] = "legacy"
-    
-    # Mark Lakeview dashboards with dashboard_type = "lakeview"
-    for d in lakeview_dashboards:
-        d["dashboard_type"] = "lakeview"
-        # Map Lakeview fields to match legacy structure for consistency
-        if "id" not in d:
-            d["id"] = d.get("dashboard_id") or d.get("object_id")
-        if "name" not in d:
-            d["name"] = d.get("display_name") or d.get("name")
-        # Extract path from parent_path (clean path, not full file path)
-        # The API returns path as full file path with .lvdash.json extension
-        # We want just the directory path (parent_path)
-        if "path" in d and d.get("path"):
-            full_path = d.get("path", "")
-            # If path contains .lvdash.json, remove the extension and filename, keep directory
-            if ".lvdash.json" in full_path:
-                # Remove .lvdash.json extension
-                path_without_ext = full_path.replace(".lvdash.json", "")
-                # Use parent_path if available, otherwise use directory part
-                d["path"] = d.get("parent_path", path_without_ext.rsplit("/", 1)[0] if "/" in path_without_ext else path_without_ext)
-            else:
-                # Use parent_path if available, otherwise use the path as-is
-                d["path"] = d.get("parent_path", full_path)
+    def fetch_legacy_dashboards() -> List[Dict]:
+        if selected_ids and len(selected_ids) <= MAX_DIRECT_FETCH_IDS:
+            # Fetch only the selected legacy dashboards instead of paging through all of them
+            logger.info("[%s] Fetching %s selected legacy dashboards...", workspace_name, len(selected_ids))
+            legacy = get_legacy_dashboards_by_id(
+                session,
+                host,
+                selected_ids,
+                concurrency=args.concurrency,
+                max_retries=args.max_retries,
+                retry_delay=args.retry_delay
+            )
         else:
-            # Use parent_path if available
-            d["path"] = d.get("parent_path", d.get("path_name", ""))
-        # Lakeview dashboards are already migrated (they're already in Lakeview format)
-        d["migrated"] = True
+            # List all legacy dashboards
+            logger.info("[%s] Fetching list of legacy dashboards...", workspace_name)
+            legacy = list_all_legacy_dashboards(
+                session,
+                host,
+                cache_ttl=args.list_cache_ttl,
+                max_retries=args.max_retries,
+                retry_delay=args.retry_delay
+            )
+        logger.info("[%s] Found %s legacy dashboards", workspace_name, len(legacy))
+        return legacy
+    
+    # The legacy and Lakeview listings are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=1) as list_executor:
+        legacy_future = list_executor.submit(fetch_legacy_dashboards)
+        
+        # List all Lakeview dashboards (for information gathering)
+        logger.info("[%s] Fetching list of Lakeview dashboards...", workspace_name)
+        lakeview_dashboards = list_all_lakeview_dashboards(
+            session, host,
+            concurrency=args.concurrency,
+            published_cache_ttl=args.published_cache_ttl,
+            max_retries=args.max_retries,
+            retry_delay=args.retry_delay
+        )
+        logger.info("[%s] Found %s Lakeview dashboards", workspace_name, len(lakeview_dashboards))
+        
+        legacy_dashboards = legacy_future.result()
+    
+    # Extract path from parent_path (clean path, not full file path)
+    # The API returns path as full file path with .lvdash.json extension
+    # We want just the directory path (parent_path)
+    lakeview_paths = []
+    if lakeview_dashboards:
+        full_path = pd.Series([d.get("path") or "" for d in lakeview_dashboards], dtype=object)
+        # If path contains .lvdash.json, remove the extension and filename, keep directory
+        has_ext = full_path.str.contains(".lvdash.json", regex=False)
+        directory = full_path.str.replace(".lvdash.json", "", regex=False).str.rsplit("/", n=1).str[0]
+        path = directory.where(has_ext, full_path)
+        # Without a path, fall back to path_name
+        path_name = pd.Series([d.get("path_name", "") for d in lakeview_dashboards], dtype=object)
+        path = path.where(full_path.astype(bool), path_name)
+        # Use parent_path whenever the API provides it
+        has_parent = pd.Series(["parent_path" in d for d in lakeview_dashboards])
+        parent_path = pd.Series([d.get("parent_path") for d in lakeview_dashboards], dtype=object)
+        lakeview_paths = parent_path.where(has_parent, path).tolist()
     
     # For migration, we only work with legacy dashboards
     dashboards = legacy_dashboards
@@ -1198,322 +2429,96 @@ def migrate_dashboards(
     # Apply filters and selection to legacy dashboards (for migration)
     dashboards = filter_dashboards(
         dashboards,
-        path_pattern=args.filter_path,
-        owner_pattern=args.filter_owner,
-        name_pattern=args.filter_name,
+        path_pattern=args.filter_path_re,
+        owner_pattern=args.filter_owner_re,
+        name_pattern=args.filter_name_re,
         selected_ids=selected_ids
     )
     
     total = len(dashboards)
-    logger.info(f"[{workspace_name}] Found {total} legacy dashboards (after filtering) for migration")
+    logger.info("[%s] Found %d legacy dashboards (after filtering) for migration", workspace_name, total)
     
     # For CSV output, include all dashboards (legacy + Lakeview)
     all_dashboards_for_csv = legacy_dashboards + lakeview_dashboards
     
     # Only return empty DataFrame if we have no dashboards at all
     if len(all_dashboards_for_csv) == 0:
-        logger.info(f"[{workspace_name}] No dashboards found.")
-        return pd.DataFrame(columns=[
-            "workspace", "legacy_id", "legacy_name", "legacy_path", "legacy_created_at",
-            "lakeview_id", "migrated", "migration_datetime", "published",
-            "publish_datetime", "deleted_legacy", "error", "dashboard_type",
-            "name", "path", "created_date", "published_date",
-            "owner", "updated_at", "description"
-        ])
+        logger.info("[%s] No dashboards found.", workspace_name)
+        return empty_log_dataframe()
     
     if total == 0:
-        logger.info(f"[{workspace_name}] No legacy dashboards to migrate, but will include Lakeview dashboards in CSV output.")
+        logger.info("[%s] No legacy dashboards to migrate, but will include Lakeview dashboards in CSV output.", workspace_name)
     
-    # Single in-memory log of all dashboards and actions
-    log_rows = []
-    skipped_count = 0
+    # Work items in listing order: (idx, dashboard, resumed log row or None)
+    work = []
+    resumed_count = 0
     
-    # Migrate each legacy dashboard
-    for idx, d in enumerate(dashboards, 1):
-        legacy_id = str(d.get("id"))
-        legacy_name = d.get("name", "Unknown")
-        legacy_path = d.get("path") or d.get("dashboard_path")
-        legacy_created_at = d.get("created_at") or d.get("create_time")
-        
-        logger.info(f"[{workspace_name}] [{idx}/{total}] Processing '{legacy_name}' ({legacy_id})...")
-        
-        # Skip if already migrated and resuming (check by workspace + legacy_id)
-        resume_key = f"{workspace_name}:{legacy_id}"
-        if args.resume and resume_key in existing_log:
-            logger.info(f"[{workspace_name}] Skipping '{legacy_name}' - already migrated (resume mode)")
-            existing_row = existing_log[resume_key].copy()
-            log_rows.append(existing_row)
-            skipped_count += 1
-            continue
-        
-        migrated = False
-        published = False
-        deleted_legacy = False
-        lakeview_id = None
-        error_msg = ""
-        migration_datetime = None
-        publish_datetime = None
-        
-        try:
-            # Record migration timestamp in UTC before calling the API
-            migration_datetime = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-            
-            # Retry logic for migration
-            result = None
-            for attempt in range(args.max_retries):
-                try:
-                    result = migrate_legacy_dashboard(session, host, d, dry_run=args.dry_run)
-                    break  # Success, exit retry loop
-                except requests.RequestException as e:
-                    if attempt < args.max_retries - 1:
-                        sleep_time = args.retry_delay * (attempt + 1)
-                        logger.warning(
-                            f"Migration failed (attempt {attempt + 1}/{args.max_retries}): "
-                            f"{type(e).__name__}. Retrying in {sleep_time}s..."
-                        )
-                        time.sleep(sleep_time)
-                    else:
-                        raise  # Re-raise on final attempt
-            
-            if result:
-                lakeview_id = result.get("id") or result.get("dashboard_id")
-                migrated = True
-                logger.info(f"[{workspace_name}] Migrated legacy '{legacy_name}' ({legacy_id}) -> AI/BI {lakeview_id}")
-        except requests.RequestException as e:
-            # Handle both HTTPError and other request exceptions (timeouts, connection errors, etc.)
-            error_msg = f"migrate_error: {type(e).__name__}"
-            if hasattr(e, 'response') and e.response is not None:
-                error_details = extract_error_details(e.response)
-                error_msg += f": {error_details}"
-            else:
-                error_msg += f": {str(e)}"
-            migration_datetime = None
-            logger.error(f"[{workspace_name}] Failed to migrate '{legacy_name}' ({legacy_id}): {error_msg}")
-        
-        # Get published status from dashboard data if available
-        # Legacy dashboards don't have published status, so it will be False initially
-        dashboard_published = d.get("published", False) or d.get("is_published", False)
-        
-        # Capture additional fields from dashboard data
-        owner = d.get("owner") or d.get("user", {}).get("user_name", "") or d.get("user_name", "")
-        updated_at = d.get("updated_at") or d.get("update_time") or d.get("modified_at", "")
-        description = d.get("description") or d.get("summary", "")
-        
-        # Ensure dates are in datetime format (ISO 8601)
-        created_date = legacy_created_at or ""
-        published_date = publish_datetime or ""
-        
-        # Add initial row for this dashboard to the log
-        log_rows.append({
-            "workspace": workspace_name,  # Workspace identifier
-            "legacy_id": legacy_id,
-            "legacy_name": legacy_name,
-            "legacy_path": legacy_path,
-            "legacy_created_at": legacy_created_at,
-            "lakeview_id": lakeview_id,
-            "migrated": migrated,  # migrated and converted are the same
-            "migration_datetime": migration_datetime,
-            "published": dashboard_published,  # Get from dashboard data
-            "publish_datetime": publish_datetime,
-            "deleted_legacy": deleted_legacy,
-            "error": error_msg,
-            "dashboard_type": "legacy",
-            "name": legacy_name,  # Dashboard name
-            "path": legacy_path,  # Dashboard path
-            "created_date": created_date,  # Created date (datetime)
-            "published_date": published_date,  # Published date (datetime)
-            "owner": owner,
-            "updated_at": updated_at,
-            "description": description,
-        })
-        
-        if not args.dry_run:
-            time.sleep(args.sleep_between_calls)
-    
-    if skipped_count > 0:
-        logger.info(f"Skipped {skipped_count} already-migrated dashboards (resume mode)")
+    # Resume keys are workspace:legacy_id (see load_existing_log)
+    resume_prefix = f"{workspace_name}:"
     
-    # Publish all migrated dashboards when requested
-    if args.publish:
-        logger.info(f"[{workspace_name}] Publishing migrated dashboards...")
-        for row in log_rows:
-            legacy_id = row["legacy_id"]
-            lakeview_id = row["lakeview_id"]
-            if not lakeview_id:
-                continue
-                
-            try:
-                # Retry logic for publishing
-                for attempt in range(args.max_retries):
-                    try:
-                        publish_dashboard(
-                            session,
-                            host,
-                            lakeview_id,
-                            warehouse_id=args.warehouse_id,
-                            dry_run=args.dry_run
-                        )
-                        break  # Success
-                    except requests.RequestException as e:
-                        if attempt < args.max_retries - 1:
-                            sleep_time = args.retry_delay * (attempt + 1)
-                            logger.warning(
-                                f"Publish failed (attempt {attempt + 1}/{args.max_retries}): "
-                                f"{type(e).__name__}. Retrying in {sleep_time}s..."
-                            )
-                            time.sleep(sleep_time)
-                        else:
-                            raise  # Re-raise on final attempt
-                
-                row["published"] = True
-                publish_time = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-                row["publish_datetime"] = publish_time
-                row["published_date"] = publish_time  # Update published_date field (datetime)
-                logger.info(f"[{workspace_name}] Published AI/BI dashboard {lakeview_id} for legacy {legacy_id}")
-            except requests.RequestException as e:
-                err = f"publish_error: {type(e).__name__}"
-                if hasattr(e, 'response') and e.response is not None:
-                    error_details = extract_error_details(e.response)
-                    err += f": {error_details}"
-                else:
-                    err += f": {str(e)}"
-                row["error"] = (row["error"] + "; " + err) if row["error"] else err
-                logger.error(f"[{workspace_name}] Failed to publish AI/BI {lakeview_id}: {err}")
-            
-            if not args.dry_run:
-                time.sleep(args.sleep_between_calls)
-    
-    # Delete legacy dashboards when requested and only if they were migrated
-    if args.delete_legacy:
-        logger.info(f"[{workspace_name}] Deleting legacy dashboards...")
+    for idx, d in enumerate(dashboards, 1):
+        # Skip if already migrated and resuming (check by workspace + legacy_id).
+        # The loaded row is owned by this run, so it is reused without copying.
+        existing_row = existing_log.get(resume_prefix + str(d.get("id"))) if args.resume else None
+        if existing_row is not None:
+            logger.info(
+                "[%s] [%d/%d] Skipping '%s' - already migrated (resume mode)",
+                workspace_name, idx, total, d.get('name', 'Unknown')
+            )
+            resumed_count += 1
+        work.append((idx, d, existing_row))
+    
+    if resumed_count:
+        logger.info("Skipped %s already-migrated dashboards (resume mode)", resumed_count)
+    
+    def process_one(idx: int, d: Dict, row: Optional[Dict]) -> Optional[Dict]:
+        # Migrate (unless resumed), then publish and delete the same dashboard.
+        # Once the run is interrupted, no further step is started; a dashboard
+        # that was never migrated gets no row, so a resumed run picks it up.
+        if stop_event.is_set():
+            return row
+        if row is None:
+            row = checkpoint(migrate_one(session, host, d, args, workspace_name, idx, total))
+        if args.publish and row["lakeview_id"] and not stop_event.is_set():
+            row = checkpoint(publish_one(session, host, row, args, workspace_name))
+        if args.delete_legacy and row["lakeview_id"] and not stop_event.is_set():
+            row = checkpoint(delete_one(session, host, row, args, workspace_name))
+        return row
+    
+    # Run each dashboard's pipeline concurrently; the pool bounds in-flight requests
+    # (an interrupted run is stopped through stop_event, which main sets)
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        log_rows = [row for row in executor.map(lambda item: process_one(*item), work) if row is not None]
+    
+    # Deleted dashboards make any cached legacy listing stale
+    if args.delete_legacy and not args.dry_run and args.list_cache_ttl > 0:
+        get_list_cache_path(session, host).unlink(missing_ok=True)
+    
+    # Dashboards published in this run must not keep a cached "not published" status
+    if args.publish and not args.dry_run and args.published_cache_ttl > 0:
+        cache_file = get_list_cache_path(session, host, PUBLISHED_CACHE_SUFFIX)
+        published_cache = load_published_cache(cache_file)
         for row in log_rows:
-            legacy_id = row["legacy_id"]
-            lakeview_id = row["lakeview_id"]
-            if not lakeview_id:
-                continue
-                
-            try:
-                # Retry logic for deletion
-                for attempt in range(args.max_retries):
-                    try:
-                        delete_legacy_dashboard(session, host, legacy_id, dry_run=args.dry_run)
-                        break  # Success
-                    except requests.RequestException as e:
-                        if attempt < args.max_retries - 1:
-                            sleep_time = args.retry_delay * (attempt + 1)
-                            logger.warning(
-                                f"Delete failed (attempt {attempt + 1}/{args.max_retries}): "
-                                f"{type(e).__name__}. Retrying in {sleep_time}s..."
-                            )
-                            time.sleep(sleep_time)
-                        else:
-                            raise  # Re-raise on final attempt
-                
-                row["deleted_legacy"] = True
-                logger.info(f"[{workspace_name}] Deleted legacy dashboard '{row['legacy_name']}' ({legacy_id})")
-            except requests.RequestException as e:
-                err = f"delete_error: {type(e).__name__}"
-                if hasattr(e, 'response') and e.response is not None:
-                    error_details = extract_error_details(e.response)
-                    err += f": {error_details}"
-                else:
-                    err += f": {str(e)}"
-                row["error"] = (row["error"] + "; " + err) if row["error"] else err
-                logger.error(f"[{workspace_name}] Failed to delete legacy '{row['legacy_name']}' ({legacy_id}): {err}")
-            
-            if not args.dry_run:
-                time.sleep(args.sleep_between_calls)
+            if row["published"] and row["lakeview_id"]:
+                published_cache.pop(row["lakeview_id"], None)
+        save_published_cache(cache_file, published_cache)
     
     # Add Lakeview dashboards to CSV output (for information only, not for migration)
-    logger.info(f"[{workspace_name}] Adding {len(lakeview_dashboards)} Lakeview dashboards to CSV output...")
-    for d in lakeview_dashboards:
-        lakeview_id = str(d.get("id") or d.get("dashboard_id") or d.get("object_id", ""))
-        lakeview_name = d.get("name") or d.get("display_name", "Unknown")
-        # Path should already be set from the mapping above
-        lakeview_path = d.get("path", "")
-        lakeview_created_at = d.get("created_at") or d.get("create_time") or d.get("created_time", "")
-        
-        # Get published status (already fetched in list_all_lakeview_dashboards)
-        is_published = d.get("is_published", False) or d.get("published", False)
-        published_at = d.get("published_at") or d.get("publish_datetime", "")
-        
-        # Capture additional fields from dashboard data (full details should be available now)
-        # Owner/creator might not be in API response, try multiple locations
-        owner = (
-            d.get("owner") or 
-            d.get("user", {}).get("user_name", "") if isinstance(d.get("user"), dict) else "" or
-            d.get("user_name", "") or 
-            d.get("creator", {}).get("user_name", "") if isinstance(d.get("creator"), dict) else "" or
-            d.get("created_by", "") or
-            ""
-        )
-        updated_at = d.get("updated_at") or d.get("update_time") or d.get("modified_at") or d.get("last_modified", "")
-        description = d.get("description") or d.get("summary", "") or d.get("display_description", "")
-        
-        # Ensure dates are in datetime format (ISO 8601)
-        created_date = lakeview_created_at or ""
-        published_date = published_at or ""
-        
-        log_rows.append({
-            "workspace": workspace_name,  # Workspace identifier
-            "legacy_id": "",  # Not a legacy dashboard
-            "legacy_name": "",
-            "legacy_path": "",
-            "legacy_created_at": "",
-            "lakeview_id": lakeview_id,
-            "migrated": True,  # Lakeview dashboards are already migrated (converted)
-            "migration_datetime": "",  # No migration date since already in Lakeview
-            "published": is_published,  # Get from dashboard data
-            "publish_datetime": published_at,
-            "deleted_legacy": False,
-            "error": "",
-            "dashboard_type": "lakeview",
-            "name": lakeview_name,  # Dashboard name
-            "path": lakeview_path,  # Dashboard path
-            "created_date": created_date,  # Created date (datetime)
-            "published_date": published_date,  # Published date (datetime)
-            "owner": owner,
-            "updated_at": updated_at,
-            "description": description,
-        })
+    logger.info("[%s] Adding %s Lakeview dashboards to CSV output...", workspace_name, len(lakeview_dashboards))
+    log_rows.extend(
+        checkpoint(build_lakeview_row(d, path, workspace_name))
+        for d, path in zip(lakeview_dashboards, lakeview_paths)
+    )
     
     # Build a DataFrame from the log rows
-    # Include all columns that might be present
-    all_columns = [
-        "workspace",  # Workspace identifier
-        "legacy_id",
-        "legacy_name",
-        "legacy_path",
-        "legacy_created_at",
-        "lakeview_id",
-        "migrated",
-        "migration_datetime",
-        "published",
-        "publish_datetime",
-        "deleted_legacy",
-        "error",
-        "dashboard_type",
-        "name",  # Dashboard name
-        "path",  # Dashboard path
-        "created_date",  # Created date (datetime)
-        "published_date",  # Published date (datetime)
-        "owner",  # Owner/creator
-        "updated_at",  # Last updated
-        "description",  # Description
-    ]
-    
-    # Only include columns that actually have data
-    columns_to_include = [col for col in all_columns if any(col in row for row in log_rows)]
-    
-    df = pd.DataFrame(log_rows)
-    
-    # Ensure all expected columns exist (fill missing with empty strings)
-    for col in all_columns:
-        if col not in df.columns:
-            df[col] = ""
-    
-    # Reorder columns
-    df = df[all_columns]
+    # Rows become tuples in column order (missing fields as empty strings),
+    # so the DataFrame is built in one pass without reindexing
+    df = pd.DataFrame.from_records(
+        [tuple(row.get(col, "") for col in LOG_COLUMNS) for row in log_rows],
+        columns=LOG_COLUMNS
+    )
+    # Pin the flag columns to bool so the summary counts never see object columns
+    df = df.astype({col: LOG_SCHEMA[col] for col in BOOL_LOG_COLUMNS})
     
     return df
 
@@ -1522,6 +2527,66 @@ def migrate_dashboards(
 # Main Entry Point
 # ============================================================================
 
+def migrate_workspace(
+    workspace: Workspace,
+    args: argparse.Namespace,
+    existing_log: Optional[MigrationLogIndex] = None,
+    log_writer: Optional[CsvLogWriter] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Run the migration for one workspace with its own authenticated session.
+    
+    Args:
+        workspace: Workspace to migrate
+        args: Parsed command line arguments
+        existing_log: Previously migrated dashboards (see load_existing_log)
+        log_writer: Optional checkpoint writer shared by all workspaces
+        
+    Returns:
+        pandas.DataFrame: Log DataFrame for the workspace, or None if it
+        failed or had no dashboards
+    """
+    workspace_name, workspace_host, workspace_token = workspace
+    
+    logger.info("\n%s", BANNER)
+    logger.info("Processing workspace: %s", workspace_name)
+    logger.info("Host: %s", workspace_host)
+    logger.info("%s", BANNER)
+    
+    # Normalize and validate host URL
+    try:
+        host = normalize_host(workspace_host)
+    except ValueError as e:
+        logger.error("[%s] Invalid host URL: %s", workspace_name, e)
+        return None
+    
+    # Create authenticated session for this workspace
+    session = create_session(
+        workspace_token,
+        pool_size=max(HTTP_POOL_SIZE, args.concurrency),
+        sleep_between_calls=args.sleep_between_calls
+    )
+    
+    # Run migration for this workspace
+    try:
+        df = migrate_dashboards(
+            session,
+            host,
+            args,
+            workspace_name=workspace_name,
+            existing_log=existing_log,
+            log_writer=log_writer
+        )
+    except MigrationInterrupted:
+        logger.warning("[%s] Stopped: run interrupted", workspace_name)
+        return None
+    except Exception as e:
+        logger.error("[%s] Failed to process workspace: %s", workspace_name, e)
+        return None
+    
+    return df if len(df) > 0 else None
+
+
 def main() -> None:
     """
     Entry point: validate configuration, run migration, and save log.
@@ -1540,10 +2605,8 @@ def main() -> None:
         try:
             config = load_config_file(args.config)
             workspaces = parse_workspaces_from_config(config)
-            # Merge other config values
-            args = merge_config_with_args(config, args)
         except Exception as e:
-            logger.error(f"Failed to load config file {args.config}: {e}")
+            logger.error("Failed to load config file %s: %s", args.config, e)
             raise SystemExit(f"Config file error: {e}")
     
     # If no workspaces from config, use single workspace from CLI/env
@@ -1553,11 +2616,7 @@ def main() -> None:
                 "Provide --host and --token, set DATABRICKS_HOST / DATABRICKS_TOKEN, "
                 "or configure workspaces in config file."
             )
-        workspaces.append({
-            "name": "default",
-            "host": args.host,
-            "token": args.token
-        })
+        workspaces = [Workspace("default", args.host, args.token)]
     
     # Validate warehouse ID if provided
     try:
@@ -1565,103 +2624,152 @@ def main() -> None:
     except ValueError as e:
         raise SystemExit(f"Invalid warehouse ID: {e}")
     
+    # Loaded only once the arguments are known to be usable
+    import numpy as np
+    import pandas as pd
+    
     # Warn if dry-run mode
     if args.dry_run:
-        logger.warning("DRY RUN MODE: No API calls will be made")
+        logger.warning("DRY RUN MODE: Dashboards are only listed; nothing will be changed")
     
-    logger.info(f"Processing {len(workspaces)} workspace(s)")
+    logger.info("Processing %s workspace(s)", len(workspaces))
     
-    # Process each workspace
-    all_dataframes = []
+    # Load previously migrated dashboards once, before the checkpoint file is reopened
+    existing_log = load_existing_log(args.log_file) if args.resume else MigrationLogIndex()
     
-    for workspace in workspaces:
-        workspace_name = workspace["name"]
-        workspace_host = workspace["host"]
-        workspace_token = workspace["token"]
-        
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing workspace: {workspace_name}")
-        logger.info(f"Host: {workspace_host}")
-        logger.info(f"{'='*60}")
-        
-        # Normalize and validate host URL
-        try:
-            host = normalize_host(workspace_host)
-        except ValueError as e:
-            logger.error(f"[{workspace_name}] Invalid host URL: {e}")
-            continue
-        
-        # Create authenticated session for this workspace
-        session = create_session(workspace_token)
-        
-        # Run migration for this workspace
-        try:
-            df = migrate_dashboards(session, host, args, workspace_name=workspace_name)
-            if len(df) > 0:
-                all_dataframes.append(df)
-        except Exception as e:
-            logger.error(f"[{workspace_name}] Failed to process workspace: {e}")
-            continue
-    
-    # Combine all dataframes
-    if all_dataframes:
-        combined_df = pd.concat(all_dataframes, ignore_index=True)
-    else:
-        # Create empty dataframe with correct columns
-        combined_df = pd.DataFrame(columns=[
-            "workspace", "legacy_id", "legacy_name", "legacy_path", "legacy_created_at",
-            "lakeview_id", "migrated", "migration_datetime", "published",
-            "publish_datetime", "deleted_legacy", "error", "dashboard_type",
-            "name", "path", "created_date", "published_date",
-            "owner", "updated_at", "description"
-        ])
+    # Checkpoint rows as they complete so an interrupted run can be resumed.
+    # A dry run has nothing to resume and must not clobber a real run's checkpoint.
+    checkpoint_file = args.log_file + CHECKPOINT_SUFFIX
+    log_writer = None if args.dry_run else CsvLogWriter(checkpoint_file, LOG_COLUMNS, append=args.resume)
+    
+    # Process workspaces in parallel; each one talks to its own host with its own session
+    results: List[Optional[pd.DataFrame]] = [None] * len(workspaces)
+    interrupted = False
+    try:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKSPACE_WORKERS, len(workspaces))) as executor:
+            futures = {
+                executor.submit(migrate_workspace, workspace, args, existing_log, log_writer): idx
+                for idx, workspace in enumerate(workspaces)
+            }
+            try:
+                # Report each workspace as soon as it finishes; one failure doesn't stop the others
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    workspace_name = workspaces[idx].name
+                    try:
+                        results[idx] = future.result()
+                    except Exception as e:
+                        logger.error("[%s] Failed to process workspace: %s", workspace_name, e)
+                        continue
+                    row_count = len(results[idx]) if results[idx] is not None else 0
+                    logger.info("[%s] Finished workspace with %d log rows", workspace_name, row_count)
+            except KeyboardInterrupt:
+                # Drop the workspaces not started yet and refuse new API calls; leaving
+                # the with block waits only for the calls already in flight, so their
+                # rows still reach the checkpoint file
+                logger.warning("Interrupted; waiting for the API calls in progress to finish...")
+                interrupted = True
+                stop_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        if log_writer:
+            log_writer.close()
+    
+    if interrupted:
+        if log_writer:
+            logger.warning(
+                "Completed dashboards were saved to %s; rerun with --resume to continue", checkpoint_file
+            )
+        raise SystemExit(130)
+    
+    # Combine in workspace order, whatever order the workspaces finished in
+    all_dataframes = [df for df in results if df is not None]
+    
+    if not all_dataframes:
+        logger.warning("No dashboards found in any workspace; nothing to log")
+        # Keep an existing log (and a resumable checkpoint) for the next run;
+        # otherwise leave a header-only log for tools that expect the file
+        log_path = Path(args.log_file)
+        if not log_path.exists():
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            log_path.write_text(",".join(LOG_COLUMNS) + "\n", encoding="utf-8")
+        if log_writer and not args.resume:
+            Path(checkpoint_file).unlink(missing_ok=True)
+        return
+    
+    # Frames share one column order and empty ones were dropped by migrate_workspace
+    combined_df = pd.concat(all_dataframes, ignore_index=True, sort=False)
+    # Few distinct values repeated on every row: store them as category codes
+    combined_df = combined_df.astype({"workspace": "category", "dashboard_type": "category"})
     
     # Display summary statistics
-    logger.info("\n" + "="*60)
+    logger.info("\n%s", BANNER)
     logger.info("=== Overall Migration Summary ===")
-    logger.info("="*60)
-    logger.info(f"Total workspaces processed: {len(workspaces)}")
-    logger.info(f"Total dashboards found: {len(combined_df)}")
-    
-    if len(combined_df) > 0:
-        logger.info(f"Successfully migrated: {combined_df['migrated'].sum()}")
-        logger.info(f"Failed migrations: {(~combined_df['migrated']).sum()}")
-        if args.publish and 'published' in combined_df.columns:
-            published_count = combined_df['published'].sum()
-            logger.info(f"Published: {published_count}")
-        if args.delete_legacy and 'deleted_legacy' in combined_df.columns:
-            deleted_count = combined_df['deleted_legacy'].sum()
-            logger.info(f"Deleted legacy: {deleted_count}")
-        
-        # Summary by workspace
-        if 'workspace' in combined_df.columns:
-            logger.info("\n=== Summary by Workspace ===")
-            for workspace_name in combined_df['workspace'].unique():
-                ws_df = combined_df[combined_df['workspace'] == workspace_name]
-                logger.info(f"\n{workspace_name}:")
-                logger.info(f"  Total dashboards: {len(ws_df)}")
-                logger.info(f"  Migrated: {ws_df['migrated'].sum()}")
-                logger.info(f"  Failed: {(~ws_df['migrated']).sum()}")
+    logger.info("%s", BANNER)
+    logger.info("Total workspaces processed: %s", len(workspaces))
+    logger.info("Total dashboards found: %s", len(combined_df))
+    
+    # Count results once on the raw flag arrays; to_numpy(dtype=bool) is free for bool
+    # columns and still counts correctly should a column come back as object.
+    # The same numbers feed the log summary and the email summary.
+    migrated_count = int(np.count_nonzero(combined_df['migrated'].to_numpy(dtype=bool)))
+    stats = {
+        "total": len(combined_df),
+        "migrated": migrated_count,
+        "failed": len(combined_df) - migrated_count,
+        "published": (
+            int(np.count_nonzero(combined_df['published'].to_numpy(dtype=bool))) if args.publish else 0
+        ),
+        "deleted": (
+            int(np.count_nonzero(combined_df['deleted_legacy'].to_numpy(dtype=bool))) if args.delete_legacy else 0
+        ),
+    }
+    
+    logger.info("Successfully migrated: %s", stats["migrated"])
+    logger.info("Failed migrations: %s", stats["failed"])
+    if args.publish:
+        logger.info("Published: %s", stats["published"])
+    if args.delete_legacy:
+        logger.info("Deleted legacy: %s", stats["deleted"])
+    
+    # Summary by workspace
+    if 'workspace' in combined_df.columns:
+        logger.info("\n=== Summary by Workspace ===")
+        # One grouped pass instead of a filtered copy per workspace
+        ws_summary = combined_df['migrated'].astype(bool).groupby(
+            combined_df['workspace'], sort=False, observed=True
+        ).agg(total='size', migrated='sum')
+        for workspace_name, total, migrated in ws_summary.itertuples():
+            logger.info("\n%s:", workspace_name)
+            logger.info("  Total dashboards: %s", total)
+            logger.info("  Migrated: %s", migrated)
+            logger.info("  Failed: %s", total - migrated)
     
     # Display the first few log rows
     logger.info("\n=== Dashboard migration log (head) ===")
-    print(combined_df.head().to_string())
+    # Render straight to stdout instead of building the table as a string first
+    combined_df.head().to_string(buf=sys.stdout)
+    sys.stdout.write("\n")
     
     # Persist log to CSV with UTF-8 encoding
     # Ensure data directory exists
     log_path = Path(args.log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    combined_df.to_csv(args.log_file, index=False, encoding='utf-8')
-    logger.info(f"\nWrote log CSV to: {args.log_file}")
+    write_log_csv(combined_df, args.log_file)
+    logger.info("\nWrote log CSV to: %s", args.log_file)
+    
+    # The complete log supersedes the checkpoint rows
+    if log_writer:
+        Path(checkpoint_file).unlink(missing_ok=True)
     
     # Send email summary if requested
     if args.send_email:
         try:
             # Use first workspace host for email (or combine if multiple)
-            email_host = workspaces[0]["host"] if workspaces else args.host
-            send_email_summary(combined_df, args, email_host)
+            email_host = workspaces[0].host if workspaces else args.host
+            send_email_summary(combined_df, args, email_host, stats)
         except Exception as e:
-            logger.error(f"Failed to send email summary: {e}")
+            logger.error("Failed to send email summary: %s", e)
 
 
 if __name__ == "__main__":